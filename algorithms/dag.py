@@ -0,0 +1,103 @@
+
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from algorithms.topological_sort import _topological_order
+import graph_cls as gc
+from graph_typing import Numeric
+
+
+def _dag_paths(graph: gc.DiGraph, u: Optional[Hashable], longest: bool) -> Tuple[Dict, Dict]:
+    """
+    Helper function to relax every edge once in topological order.
+
+    :param graph: a directed acyclic graph
+
+    :param u: hashable object; the source node.  If None, every node is a source at distance 0.
+
+    :param longest: bool; if True, find longest paths else shortest paths
+
+    :return: 2 element tuple.  1st element is a dict keyed by node and its distance.  2nd element is a dict keyed by
+    node and its previous node in the path.
+    """
+    order = _topological_order(graph)
+    if u is None:
+        distances = dict.fromkeys(order, 0)
+    else:
+        graph._assert_node_exists(u)
+        distances = {u: 0}
+        order = order[order.index(u):]
+    prev = {}
+
+    for curr_node in order:
+        if curr_node not in distances:
+            continue
+        curr_distance = distances[curr_node]
+        for neighbor in graph.g[curr_node]:
+            distance = curr_distance + graph.edge_weights[(curr_node, neighbor)]
+            if neighbor not in distances:
+                improves = True
+            elif longest:
+                improves = distance > distances[neighbor]
+            else:
+                improves = distance < distances[neighbor]
+            if improves:
+                distances[neighbor] = distance
+                prev[neighbor] = curr_node
+    return distances, prev
+
+
+def _to_pair_dicts(u: Hashable, distances: Dict, prev: Dict) -> Tuple[Dict, Dict]:
+    distance_dict = {(u, node): distance for node, distance in distances.items() if node != u}
+    prev_dict = {(u, node): prev_node for node, prev_node in prev.items()}
+    return distance_dict, prev_dict
+
+
+def dag_shortest_path(graph: gc.DiGraph, u: Hashable) -> Tuple[Dict, Dict]:
+    """
+    Find single-source shortest paths in a directed acyclic graph in O(V + E).  Negative edge weights are allowed.
+
+    :param graph: a directed acyclic graph
+
+    :param u: hashable object; the source node
+
+    :return: 2 element tuple.  1st element is a dict keyed by the source-node / target-node tuple and values of the
+    distance to the source node.  2nd element is a dict keyed by the source-node / target-node tuple and its
+    previous node in the shortest path.
+    """
+    return _to_pair_dicts(u, *_dag_paths(graph, u, longest=False))
+
+
+def dag_longest_path(graph: gc.DiGraph, u: Hashable) -> Tuple[Dict, Dict]:
+    """
+    Find single-source longest paths in a directed acyclic graph in O(V + E).
+
+    :param graph: a directed acyclic graph
+
+    :param u: hashable object; the source node
+
+    :return: 2 element tuple.  1st element is a dict keyed by the source-node / target-node tuple and values of the
+    longest distance to the source node.  2nd element is a dict keyed by the source-node / target-node tuple and its
+    previous node in the longest path.
+    """
+    return _to_pair_dicts(u, *_dag_paths(graph, u, longest=True))
+
+
+def critical_path(graph: gc.DiGraph) -> Tuple[List, Numeric]:
+    """
+    Find the critical path, the longest path anywhere in a directed acyclic graph, e.g. the chain of tasks that
+    bounds the duration of a schedule.
+
+    :param graph: a directed acyclic graph
+
+    :return: 2-element tuple of the critical path and its length.  Return an empty list and 0 for an empty graph.
+    """
+    distances, prev = _dag_paths(graph, None, longest=True)
+    if not distances:
+        return [], 0
+
+    v = max(distances, key=distances.get)
+    path = deque([v])
+    while path[0] in prev:
+        path.appendleft(prev[path[0]])
+    return list(path), distances[v]
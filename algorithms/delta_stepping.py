@@ -0,0 +1,205 @@
+
+from multiprocessing import Pool
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from exceptions import NodeNotInGraphException
+from graph_cls import GraphTypeHint
+from graph_typing import Numeric
+from parallel.csr import CSRGraph, to_csr
+import parallel.shared_csr as shared_csr
+
+
+Requests = Dict[int, Tuple[Numeric, int]]
+
+
+def _auto_delta(csr: CSRGraph) -> float:
+    """
+    Helper function to pick the bucket width as the maximum edge weight divided by the average out-degree, so a
+    bucket holds roughly one edge length's worth of nodes per neighbor.
+
+    :param csr: CSRGraph
+
+    :return: float; the bucket width
+    """
+    if not len(csr.weights):
+        return 1.0
+    average_degree = len(csr.targets) / len(csr)
+    delta = max(csr.weights) / average_degree
+    return delta if delta > 0 else 1.0
+
+
+def _edge_requests(csr: CSRGraph, frontier: Iterable[Tuple[int, Numeric]], delta: float, light: bool) -> Requests:
+    """
+    Helper function to generate the relaxation requests of the light (weight <= delta) or heavy edges leaving the
+    frontier, keeping only the best request per target node.
+
+    :param csr: CSRGraph
+
+    :param frontier: iterable of 2-element tuples of node index and its distance
+
+    :param delta: float; the bucket width
+
+    :param light: bool; if True, relax light edges else heavy edges
+
+    :return: dict keyed by target node index and a 2-element tuple of the tentative distance and the source node index
+    """
+    offsets = csr.offsets
+    targets = csr.targets
+    weights = csr.weights
+    requests = {}
+    for node, distance in frontier:
+        for k in range(offsets[node], offsets[node + 1]):
+            weight = weights[k]
+            if (weight <= delta) == light:
+                target = targets[k]
+                new_distance = distance + weight
+                best = requests.get(target)
+                if (best is None) or (new_distance < best[0]):
+                    requests[target] = (new_distance, node)
+    return requests
+
+
+def _edge_requests_numpy(csr: CSRGraph, frontier: List[Tuple[int, Numeric]], delta: float, light: bool) -> Requests:
+    """
+    Helper function to generate the same requests as _edge_requests with NumPy.  The edges leaving the frontier are
+    gathered with np.repeat over the row offsets, and the best request per target is the first of its run after
+    sorting by target and distance.  The sort is stable, so ties keep the first request like _edge_requests.
+
+    :param csr: CSRGraph
+
+    :param frontier: list of 2-element tuples of node index and its distance
+
+    :param delta: float; the bucket width
+
+    :param light: bool; if True, relax light edges else heavy edges
+
+    :return: dict keyed by target node index and a 2-element tuple of the tentative distance and the source node index
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError('use_numpy=True requires numpy') from e
+
+    # Views over the CSR buffers, so no arrays are copied
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    targets = np.frombuffer(csr.targets, dtype=np.int64)
+    weights = np.frombuffer(csr.weights, dtype=np.float64)
+
+    nodes = np.fromiter((node for node, _distance in frontier), dtype=np.int64, count=len(frontier))
+    distances = np.fromiter((distance for _node, distance in frontier), dtype=np.float64, count=len(frontier))
+    starts = offsets[nodes]
+    degrees = offsets[nodes + 1] - starts
+    n_edges = int(degrees.sum())
+    if not n_edges:
+        return {}
+    edges = np.repeat(starts - (np.cumsum(degrees) - degrees), degrees) + np.arange(n_edges)
+    edge_weights = weights[edges]
+    keep = np.flatnonzero((edge_weights <= delta) == light)
+    if not len(keep):
+        return {}
+    sources = np.repeat(nodes, degrees)[keep]
+    new_distances = np.repeat(distances, degrees)[keep] + edge_weights[keep]
+    edge_targets = targets[edges[keep]]
+
+    order = np.lexsort((new_distances, edge_targets))
+    sorted_targets = edge_targets[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_targets[1:] != sorted_targets[:-1]
+    best = order[first]
+    return dict(zip(edge_targets[best].tolist(), zip(new_distances[best].tolist(), sources[best].tolist())))
+
+
+def _edge_requests_in_worker(
+        frontier: List[Tuple[int, Numeric]], delta: float, light: bool, use_numpy: bool
+) -> Requests:
+    edge_requests = _edge_requests_numpy if use_numpy else _edge_requests
+    return edge_requests(shared_csr._worker_csr, frontier, delta, light)
+
+
+def delta_stepping(
+        graph: GraphTypeHint, u: Hashable, delta: Optional[float] = None, processes: Optional[int] = None,
+        parallel_threshold: int = 10_000, use_numpy: bool = False
+) -> Tuple[Dict, Dict]:
+    """
+    Perform delta-stepping for single-source shortest paths.  Tentative distances are kept in buckets of width
+    delta; all nodes of the lowest bucket are settled together by relaxing their light edges in bulk, then their heavy
+    edges once.
+
+    :param graph: Graph or DiGraph object.  Edge weights must be non-negative.
+
+    :param u: hashable object; the source node
+
+    :param delta: optional; positive float bucket width.  Default is None, which picks the width from the edge weights
+    and the average degree.
+
+    :param processes: optional; number of worker processes for generating relaxation requests.  Default is None,
+    which relaxes edges in this process.
+
+    :param parallel_threshold: int; minimum number of frontier nodes before work is split across processes.
+    Default is 10,000.
+
+    :param use_numpy: bool; default is False.  If True, generate the relaxation requests with vectorized NumPy
+    operations.
+
+    :return: 2 element tuple in the output format of djikstra.  Distances are floats.
+    """
+    if u not in graph:
+        raise NodeNotInGraphException(u)
+    if graph.has_negative_weights:
+        raise ValueError('graph must not contain negative edge weights')
+    if (delta is not None) and (delta <= 0):
+        raise ValueError('delta must be positive')
+
+    csr = shared_csr.SharedCSR.from_graph(graph) if processes else to_csr(graph)
+    delta = _auto_delta(csr) if delta is None else delta
+    pool = Pool(processes, initializer=shared_csr._init_worker, initargs=(csr.handle,)) if processes else None
+    edge_requests = _edge_requests_numpy if use_numpy else _edge_requests
+
+    def requests_for(frontier: List[Tuple[int, Numeric]], light: bool) -> Requests:
+        if (pool is None) or (len(frontier) < parallel_threshold):
+            return edge_requests(csr, frontier, delta, light)
+        chunk_size = -(-len(frontier) // processes)
+        chunks = [frontier[i:i + chunk_size] for i in range(0, len(frontier), chunk_size)]
+        args = [(chunk, delta, light, use_numpy) for chunk in chunks]
+        requests = {}
+        for chunk_requests in pool.starmap(_edge_requests_in_worker, args):
+            for target, request in chunk_requests.items():
+                if (target not in requests) or (request[0] < requests[target][0]):
+                    requests[target] = request
+        return requests
+
+    source = csr.index[u]
+    distances = [float('inf')] * len(csr)
+    prev = [-1] * len(csr)
+    buckets = {}
+
+    def relax(requests: Requests) -> None:
+        for target, (distance, node) in requests.items():
+            if distance < distances[target]:
+                if distances[target] < float('inf'):
+                    buckets.get(int(distances[target] // delta), set()).discard(target)
+                distances[target] = distance
+                prev[target] = node
+                buckets.setdefault(int(distance // delta), set()).add(target)
+
+    try:
+        relax({source: (0, -1)})
+        while buckets:
+            i = min(buckets)
+            settled = []
+            while buckets.get(i):
+                frontier = [(node, distances[node]) for node in buckets.pop(i)]
+                settled.extend(frontier)
+                relax(requests_for(frontier, light=True))
+            buckets.pop(i, None)
+            # Heavy edges cannot land in bucket i, so they are relaxed once the bucket is empty
+            relax(requests_for([(node, distances[node]) for node, _distance in settled], light=False))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+            csr.unlink()
+
+    distance_dict = {i: distance for i, distance in enumerate(distances) if distance < float('inf')}
+    prev_dict = {i: prev_node for i, prev_node in enumerate(prev) if prev_node >= 0}
+    return csr.to_labels(source, distance_dict, prev_dict)
@@ -1,35 +1,52 @@
 
-from typing import Dict, Set, Hashable, Tuple
-
-import graph_typing as gt
+import heapq
+from typing import Dict, Hashable, Iterable, List, Tuple, Union
 
 from exceptions import NodeNotInGraphException
 from graph_cls import GraphTypeHint
+from graph_typing import Numeric
 
 
-def _get_next_node_smallest_distance(
-        distance_dict: Dict, visited_nodes: Set
-) -> Tuple[Hashable, gt.Numeric]:
+def _djikstra_ids(graph: GraphTypeHint, seeds: List[Tuple[Numeric, int]]) -> Tuple[List, List[int], List[int]]:
     """
-    Helper function to get the next unvisited node with the smallest distance from source.
+    Helper function to perform Djikstra's Algorithm on node ids from one or more seeded nodes.
 
-    :param distance_dict: dict keyed by nodes and distances from the source node as values
+    :param graph: Graph or DiGraph object
 
-    :param visited_nodes: set of nodes already visited
+    :param seeds: list of 2-element tuples of a starting distance and a node id
 
-    :return: 2-element tuple of the next node and its corresponding distance from source.
+    :return: 3 element tuple of lists indexed by node id.  1st element is the distance, or float('inf') if unreached.
+    2nd element is the previous node id in the shortest path, or -1.  3rd element is the id of the seed the shortest
+    path starts from, or -1.
     """
-    min_distance = float('inf')
-    min_node = None
-
-    for node, distance in distance_dict.items():
-        if node in visited_nodes:
+    adjacency = graph.id_adjacency()
+    visited_nodes = bytearray(graph.id_capacity)
+    distances = [float('inf')] * graph.id_capacity
+    prev = [-1] * graph.id_capacity
+    origin = [-1] * graph.id_capacity
+    for distance, node in seeds:
+        if distance < distances[node]:
+            distances[node] = distance
+            origin[node] = node
+
+    # Binary heap of (distance, node id); stale entries are skipped when popped
+    queue = [(distance, node) for distance, node in seeds]
+    heapq.heapify(queue)
+    while queue:
+        curr_distance, curr_node = heapq.heappop(queue)
+        if visited_nodes[curr_node] or (curr_distance > distances[curr_node]):
             continue
-        if distance < min_distance:
-            min_distance = distance
-            min_node = node
-
-    return min_node, min_distance
+        visited_nodes[curr_node] = 1
+        for neighbor, weight in adjacency[curr_node]:
+            if visited_nodes[neighbor]:
+                continue
+            distance = curr_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                prev[neighbor] = curr_node
+                origin[neighbor] = origin[curr_node]
+                heapq.heappush(queue, (distance, neighbor))
+    return distances, prev, origin
 
 
 def djikstra(graph: GraphTypeHint, u: Hashable) -> Tuple[Dict, Dict]:
@@ -44,36 +61,54 @@ def djikstra(graph: GraphTypeHint, u: Hashable) -> Tuple[Dict, Dict]:
     distance to the source node.  2nd element is a dict keyed by the source-node / target-node tuple and its
     previous node in the shortest path.
     """
-    if u not in graph.nodes:
+    if u not in graph:
         raise NodeNotInGraphException(u)
 
-    unvisited_nodes = graph.nodes
-    visited_nodes = set()
-
-    distance_dict = dict.fromkeys(unvisited_nodes, float('inf'))
-    distance_dict[u] = 0
-
-    prev_dict = dict.fromkeys(unvisited_nodes, None)
-    curr_node = u
-    neighbors = graph.get_neighbors(curr_node)
-
-    while neighbors:
-        for neighbor in neighbors:
-            curr_distance = graph.get_edge_weight(curr_node, neighbor) + distance_dict[curr_node]
-            min_distance = distance_dict[neighbor]
-            if curr_distance < min_distance:
-                distance_dict[neighbor] = curr_distance
-                prev_dict[neighbor] = curr_node
-        visited_nodes.add(curr_node)
-        curr_node, _distance = _get_next_node_smallest_distance(distance_dict, visited_nodes)
-        if (curr_node is None) or (_distance == float('inf')):
-            break
-        neighbors = graph.get_neighbors(curr_node) - visited_nodes
+    # The search runs on node ids; labels are only used to build the output
+    source = graph.node_id(u)
+    distances, prev, _origin = _djikstra_ids(graph, [(0, source)])
 
+    node_label = graph.node_label
     distance_dict = {
-        (u, node): distance for node, distance in distance_dict.items()
-        if (distance < float('inf')) and (node != u)
+        (u, node_label(node)): distance for node, distance in enumerate(distances)
+        if (distance < float('inf')) and (node != source)
     }
-    prev_dict = {(u, node): prev for node, prev in prev_dict.items() if prev is not None}
+    prev_dict = {(u, node_label(node)): node_label(prev_node) for node, prev_node in enumerate(prev) if prev_node >= 0}
+
+    return distance_dict, prev_dict
+
+
+def multi_source_djikstra(
+        graph: GraphTypeHint, sources: Union[Iterable[Hashable], Dict[Hashable, Numeric]]
+) -> Tuple[Dict, Dict]:
+    """
+    Perform Djikstra's Algorithm from several source nodes at once.  Every source is pushed onto the heap before the
+    search starts, so a single pass labels each node with its nearest source.
 
+    :param graph: Graph or DiGraph object
+
+    :param sources: iterable of source nodes, which start at distance 0, or dict keyed by source node and its
+    starting distance
+
+    :return: 2 element tuple.  1st element is a dict keyed by the nearest-source / target-node tuple and values of
+    the distance to the nearest source, including every source node that is its own nearest source.  2nd element is
+    a dict keyed by the nearest-source / target-node tuple and its previous node in the shortest path.
+    """
+    offsets = sources if isinstance(sources, dict) else dict.fromkeys(sources, 0)
+    for source in offsets:
+        if source not in graph:
+            raise NodeNotInGraphException(source)
+
+    seeds = [(distance, graph.node_id(source)) for source, distance in offsets.items()]
+    distances, prev, origin = _djikstra_ids(graph, seeds)
+
+    node_label = graph.node_label
+    distance_dict = {
+        (node_label(origin[node]), node_label(node)): distance for node, distance in enumerate(distances)
+        if distance < float('inf')
+    }
+    prev_dict = {
+        (node_label(origin[node]), node_label(node)): node_label(prev_node)
+        for node, prev_node in enumerate(prev) if prev_node >= 0
+    }
     return distance_dict, prev_dict
@@ -0,0 +1,138 @@
+
+from typing import Hashable
+
+from algorithms.bellman_ford import bellman_ford
+from algorithms.djikstra import djikstra
+from algorithms.floyd_warshall import floyd_warshall
+import graph_typing as gt
+from graph_cls import GraphTypeHint
+
+
+class DynamicAllPairsShortestPath:
+    """
+    Class DynamicAllPairsShortestPath for all-pairs shortest paths that stay current as the graph changes.  The
+    distance and previous-node dicts have the same format as the output of floyd_warshall.
+    """
+    def __init__(self, graph: GraphTypeHint):
+        """
+        Instantiate an object of class DynamicAllPairsShortestPath.  The distances are seeded with Floyd-Warshall's
+        algorithm and the object registers itself as an observer of the graph.
+
+        :param graph: Graph or DiGraph object
+        """
+        self.graph = graph
+        self.distance_dict, self.prev_dict = floyd_warshall(graph)
+        graph.add_observer(self)
+
+    def close(self) -> None:
+        """
+        Stop tracking changes to the graph.
+
+        :return: None
+        """
+        self.graph.remove_observer(self)
+
+    def node_added(self, node: Hashable) -> None:
+        self.distance_dict[(node, node)] = 0
+
+    def node_removed(self, node: Hashable) -> None:
+        # The outgoing edges have already been removed, so the node only remains as a path endpoint
+        for other in self.graph.g:
+            self.distance_dict.pop((node, other), None)
+            self.prev_dict.pop((node, other), None)
+            self.distance_dict.pop((other, node), None)
+            self.prev_dict.pop((other, node), None)
+        self.distance_dict.pop((node, node), None)
+
+    def check_edge(self, u: Hashable, v: Hashable, weight: gt.Numeric) -> None:
+        # Called before the edge is added, so a rejected edge leaves the graph and the distances unchanged
+        if weight >= 0:
+            return
+        if not self.graph.is_directed:
+            raise ValueError('graph contains negative cycles')
+        distance = 0 if u == v else self.distance_dict.get((v, u), float('inf'))
+        if distance + weight < 0:
+            raise ValueError('graph contains negative cycles')
+
+    def edge_added(self, u: Hashable, v: Hashable, weight: gt.Numeric, old_weight: gt.Numeric) -> None:
+        if (old_weight is None) or (weight < old_weight):
+            self._decrease(u, v, weight)
+        elif weight > old_weight:
+            self._increase(u, v, old_weight)
+
+    def edge_removed(self, u: Hashable, v: Hashable, weight: gt.Numeric) -> None:
+        self._increase(u, v, weight)
+
+    def _decrease(self, u: Hashable, v: Hashable, weight: gt.Numeric) -> None:
+        """
+        Helper function to update the distances in O(V^2) after edge u-v is inserted or its weight drops.  Every
+        path that improves is a path x ~> u -> v ~> y through the new edge.
+
+        :param u: hashable object; the source node of the edge.
+
+        :param v: hashable object; the target node of the edge.
+
+        :param weight: numeric; the new edge weight
+
+        :return: None
+        """
+        inf = float('inf')
+        distance_dict = self.distance_dict
+        prev_dict = self.prev_dict
+        nodes = self.graph.g
+
+        if weight >= distance_dict.get((u, v), inf):
+            return
+
+        sources = [(x, distance_dict[(x, u)]) for x in nodes if (x, u) in distance_dict]
+        targets = [(y, distance_dict[(v, y)], prev_dict.get((v, y), u)) for y in nodes if (v, y) in distance_dict]
+        for x, x_distance in sources:
+            for y, y_distance, y_prev in targets:
+                distance = x_distance + weight + y_distance
+                if (x != y) and (distance < distance_dict.get((x, y), inf)):
+                    distance_dict[(x, y)] = distance
+                    prev_dict[(x, y)] = y_prev
+
+    def _increase(self, u: Hashable, v: Hashable, old_weight: gt.Numeric) -> None:
+        """
+        Helper function to update the distances after edge u-v is removed or its weight rises.  Only the sources
+        whose shortest path tree contains the edge are affected; their rows are recomputed from scratch.
+
+        :param u: hashable object; the source node of the edge.
+
+        :param v: hashable object; the target node of the edge.
+
+        :param old_weight: numeric; the edge weight before the change
+
+        :return: None
+        """
+        inf = float('inf')
+        affected_sources = [
+            x for x in self.graph.g
+            if (self.prev_dict.get((x, v)) == u)
+            and (self.distance_dict.get((x, u), inf) + old_weight == self.distance_dict[(x, v)])
+        ]
+        if not affected_sources:
+            return
+
+        single_source = bellman_ford if self.graph.has_negative_weights else djikstra
+        for x in affected_sources:
+            self._recompute_row(x, single_source)
+
+    def _recompute_row(self, source: Hashable, single_source) -> None:
+        """
+        Helper function to replace the distances and previous nodes of paths starting at the source node.
+
+        :param source: hashable object; the source node
+
+        :param single_source: single-source shortest path function, e.g. djikstra or bellman_ford
+
+        :return: None
+        """
+        for node in self.graph.g:
+            self.distance_dict.pop((source, node), None)
+            self.prev_dict.pop((source, node), None)
+        distance_dict, prev_dict = single_source(self.graph, source)
+        self.distance_dict.update(distance_dict)
+        self.distance_dict[(source, source)] = 0
+        self.prev_dict.update(prev_dict)
@@ -0,0 +1,243 @@
+
+import heapq
+from multiprocessing import Pool
+import time
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import graph_cls as gc
+from graph_typing import Numeric
+
+
+WeightedEdge = Tuple[int, int, Numeric]
+
+
+class _UnionFind:
+    """
+    Disjoint sets over the integers 0 to n - 1 with union by size and path halving.
+    """
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+        if self.size[x] < self.size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.size[x] += self.size[y]
+        return True
+
+
+def _undirected_edges(graph: gc.Graph) -> List[Tuple[Numeric, int, int]]:
+    """
+    Helper function to list each undirected edge once, as (weight, node id, node id) with the smaller id first.
+    Self-loops are skipped.
+
+    :param graph: an undirected graph
+
+    :return: list of 3-element tuples
+    """
+    if graph.is_directed:
+        raise TypeError('graph must be undirected graph')
+    node_ids = {node: graph.node_id(node) for node in graph.g}
+    edges = []
+    for (u, v), weight in graph.edge_weights.items():
+        u_id, v_id = node_ids[u], node_ids[v]
+        if u_id < v_id:
+            edges.append((weight, u_id, v_id))
+    return edges
+
+
+def _to_labels(graph: gc.Graph, edges: List[Tuple[Numeric, int, int]]) -> List[WeightedEdge]:
+    node_label = graph.node_label
+    return [(node_label(u), node_label(v), weight) for weight, u, v in edges]
+
+
+def kruskal(graph: gc.Graph) -> List[WeightedEdge]:
+    """
+    Perform Kruskal's algorithm for a minimum spanning forest: scan edges by increasing weight and keep those that
+    join two different components.
+
+    :param graph: an undirected graph
+
+    :return: list of 3-element tuples of node, node and edge weight
+    """
+    edges = _undirected_edges(graph)
+    edges.sort()
+    components = _UnionFind(graph.id_capacity)
+    forest = [edge for edge in edges if components.union(edge[1], edge[2])]
+    return _to_labels(graph, forest)
+
+
+def prim(graph: gc.Graph) -> List[WeightedEdge]:
+    """
+    Perform Prim's algorithm with a binary heap for a minimum spanning forest, growing one tree per component.
+
+    :param graph: an undirected graph
+
+    :return: list of 3-element tuples of node, node and edge weight
+    """
+    if graph.is_directed:
+        raise TypeError('graph must be undirected graph')
+    adjacency = graph.id_adjacency()
+    in_tree = bytearray(graph.id_capacity)
+    forest = []
+    for root in map(graph.node_id, graph.g):
+        if in_tree[root]:
+            continue
+        in_tree[root] = 1
+        queue = [(weight, root, neighbor) for neighbor, weight in adjacency[root]]
+        heapq.heapify(queue)
+        while queue:
+            weight, u, v = heapq.heappop(queue)
+            if in_tree[v]:
+                continue
+            in_tree[v] = 1
+            forest.append((weight, u, v))
+            for neighbor, neighbor_weight in adjacency[v]:
+                if not in_tree[neighbor]:
+                    heapq.heappush(queue, (neighbor_weight, v, neighbor))
+    return _to_labels(graph, forest)
+
+
+_worker_edges: List[Tuple[Numeric, int, int]] = []
+
+
+def _init_boruvka_worker(edges: List[Tuple[Numeric, int, int]]) -> None:
+    global _worker_edges
+    _worker_edges = edges
+
+
+def _cheapest_edges(components: List[int], start: int, stop: int, edges=None) -> Dict[int, int]:
+    """
+    Helper function to find the cheapest edge leaving each component among edges[start:stop].  Edges are compared
+    by (weight, edge index) so ties are broken consistently and no cycle is formed.
+
+    :param components: list indexed by node id of its component root
+
+    :param start: int; index of the first edge to scan
+
+    :param stop: int; index past the last edge to scan
+
+    :param edges: optional; list of edges.  Default is None, which uses the edges given to the worker process.
+
+    :return: dict keyed by component root and the index of its cheapest outgoing edge
+    """
+    edges = _worker_edges if edges is None else edges
+    cheapest = {}
+    for i in range(start, stop):
+        weight, u, v = edges[i]
+        u_component, v_component = components[u], components[v]
+        if u_component == v_component:
+            continue
+        for component in (u_component, v_component):
+            best = cheapest.get(component)
+            if (best is None) or ((weight, i) < (edges[best][0], best)):
+                cheapest[component] = i
+    return cheapest
+
+
+def boruvka(graph: gc.Graph, processes: Optional[int] = None, chunk_size: int = 100_000) -> List[WeightedEdge]:
+    """
+    Perform Boruvka's algorithm for a minimum spanning forest.  Each round adds the cheapest edge leaving every
+    component; the edge scan of each round is split across a process pool.
+
+    :param graph: an undirected graph
+
+    :param processes: optional; number of worker processes.  Default is None, which scans edges in this process.
+
+    :param chunk_size: int; number of edges scanned per task.  Default is 100,000.
+
+    :return: list of 3-element tuples of node, node and edge weight
+    """
+    edges = _undirected_edges(graph)
+    union_find = _UnionFind(graph.id_capacity)
+    chunks = [(start, min(start + chunk_size, len(edges))) for start in range(0, len(edges), chunk_size)]
+    pool = Pool(processes, initializer=_init_boruvka_worker, initargs=(edges,)) if processes else None
+
+    forest = []
+    try:
+        while True:
+            components = [union_find.find(node) for node in range(graph.id_capacity)]
+            if pool is None:
+                results = [_cheapest_edges(components, start, stop, edges) for start, stop in chunks]
+            else:
+                results = pool.starmap(_cheapest_edges, [(components, start, stop) for start, stop in chunks])
+
+            cheapest = {}
+            for result in results:
+                for component, i in result.items():
+                    best = cheapest.get(component)
+                    if (best is None) or ((edges[i][0], i) < (edges[best][0], best)):
+                        cheapest[component] = i
+            if not cheapest:
+                break
+
+            for i in set(cheapest.values()):
+                weight, u, v = edges[i]
+                if union_find.union(u, v):
+                    forest.append(edges[i])
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return _to_labels(graph, forest)
+
+
+def minimum_spanning_tree(
+        graph: gc.Graph, algorithm: str = 'kruskal', as_graph: bool = True, processes: Optional[int] = None
+) -> Tuple[Union[gc.Graph, Iterator[WeightedEdge]], Numeric]:
+    """
+    Find a minimum spanning tree of an undirected graph, or a minimum spanning forest if the graph is not connected.
+
+    :param graph: an undirected graph
+
+    :param algorithm: str; one of 'kruskal', 'prim' or 'boruvka'.  Default is 'kruskal'.
+
+    :param as_graph: bool; default is True.  If True, return the tree as a new Graph with every node of the input
+    graph, else as an iterator of (node, node, edge weight) tuples.
+
+    :param processes: optional; number of worker processes for 'boruvka'.  Default is None.
+
+    :return: 2-element tuple of the tree and its total weight
+    """
+    if algorithm == 'kruskal':
+        edges = kruskal(graph)
+    elif algorithm == 'prim':
+        edges = prim(graph)
+    elif algorithm == 'boruvka':
+        edges = boruvka(graph, processes)
+    else:
+        raise ValueError("algorithm must be one of 'kruskal', 'prim' or 'boruvka'")
+
+    total_weight = sum(weight for _u, _v, weight in edges)
+    if as_graph:
+        return gc.Graph.from_iterable(edges, nodes=graph.g), total_weight
+    return iter(edges), total_weight
+
+
+def benchmark_minimum_spanning_tree(graph: gc.Graph, processes: Optional[int] = None) -> Dict[str, Dict]:
+    """
+    Time Kruskal's, Prim's and Boruvka's algorithms on the graph.
+
+    :param graph: an undirected graph
+
+    :param processes: optional; number of worker processes for Boruvka's algorithm.  Default is None.
+
+    :return: dict keyed by algorithm name and a dict of its run time in seconds and total weight
+    """
+    results = {}
+    for algorithm in ('kruskal', 'prim', 'boruvka'):
+        start_time = time.perf_counter()
+        _edges, total_weight = minimum_spanning_tree(graph, algorithm, as_graph=False, processes=processes)
+        results[algorithm] = {'time': time.perf_counter() - start_time, 'total_weight': total_weight}
+    return results
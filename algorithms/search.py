@@ -1,36 +1,122 @@
 
-from collections import deque
-from typing import Generator, Hashable
+from typing import Dict, Generator, Hashable, List, Tuple
 
 from graph_cls import GraphTypeHint
 
 
-def _search(graph: GraphTypeHint, source: Hashable, breadth_first: bool) -> Generator:
+def _incoming_adjacency(graph: GraphTypeHint) -> List[Tuple[int, ...]]:
     """
-    Helper function to perform breadth / depth first search
+    Helper function to get the incoming neighbors of every node in terms of node ids.  Undirected graphs store both
+    directions of each edge, so their outgoing neighbors are reused.
 
     :param graph: directed or undirected graph
 
-    :param source: hashable object; the source node
+    :return: list indexed by node id of tuples of incoming neighbor ids
+    """
+    adjacency = graph.id_adjacency()
+    if not graph.is_directed:
+        return [tuple(neighbor for neighbor, _weight in neighbors) for neighbors in adjacency]
+    incoming = [[] for _ in range(len(adjacency))]
+    for node, neighbors in enumerate(adjacency):
+        for neighbor, _weight in neighbors:
+            incoming[neighbor].append(node)
+    return [tuple(neighbors) for neighbors in incoming]
+
+
+def _bfs_levels(
+        graph: GraphTypeHint, source: int, parents: Dict[int, int], alpha: float = 14, beta: float = 24
+) -> Generator[List[int], None, None]:
+    """
+    Helper function to perform direction-optimizing level-synchronous breadth first search on node ids.  Each level
+    is expanded top-down from the frontier while the frontier is small, and bottom-up (every unvisited node looks for
+    a parent in the frontier bitmap) while the frontier's edges outnumber the unexplored edges divided by alpha.  The
+    search switches back to top-down once the frontier shrinks below the number of nodes divided by beta.  Top-down
+    levels only touch the visited nodes, so a search that stays top-down costs time proportional to what it reaches.
+
+    :param graph: directed or undirected graph
 
-    :param breadth_first: bool; if True, perform bfs else dfs
+    :param source: int; the node id of the source node
 
-    :return: generator
-    """
-    queue = deque(graph.get_neighbors(source))
-    visited_nodes = {source}
-    while queue:
-        curr_node = queue.popleft()
-        if curr_node in visited_nodes:
-            continue
-        yield curr_node
-        visited_nodes.add(curr_node)
-        neighbors = graph.get_neighbors(curr_node) - visited_nodes
+    :param parents: dict filled in with the node id of each reached node and the node id of its parent
 
-        if breadth_first:
-            queue.extend(neighbors)
+    :param alpha: float; threshold for switching to bottom-up expansion.  Default is 14.
+
+    :param beta: float; threshold for switching back to top-down expansion.  Default is 24.
+
+    :return: generator of lists of node ids, one per level after the source node
+    """
+    adjacency = graph.id_adjacency()
+    n = graph.order
+    incoming = None
+    visited = {source}
+    frontier = [source]
+    # Every adjacency entry has its own edge_weights key, so the edge count needs no pass over the adjacency
+    unexplored_edges = len(graph.edge_weights) - len(adjacency[source])
+    bottom_up = False
+
+    while frontier:
+        frontier_edges = sum(len(adjacency[node]) for node in frontier)
+        if not bottom_up and (frontier_edges * alpha > unexplored_edges):
+            bottom_up = True
+        elif bottom_up and (len(frontier) * beta < n):
+            bottom_up = False
+
+        next_frontier = []
+        if bottom_up:
+            if incoming is None:
+                incoming = _incoming_adjacency(graph)
+            in_frontier = set(frontier)
+            for node in graph._node_ids.values():
+                if node in visited:
+                    continue
+                for neighbor in incoming[node]:
+                    if neighbor in in_frontier:
+                        parents[node] = neighbor
+                        next_frontier.append(node)
+                        break
+            visited.update(next_frontier)
         else:
-            queue.extendleft(neighbors)
+            for node in frontier:
+                for neighbor, _weight in adjacency[node]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        parents[neighbor] = node
+                        next_frontier.append(neighbor)
+
+        unexplored_edges -= sum(len(adjacency[node]) for node in next_frontier)
+        frontier = next_frontier
+        if frontier:
+            yield frontier
+
+
+def bfs_levels(
+        graph: GraphTypeHint, source: Hashable, alpha: float = 14, beta: float = 24
+) -> Tuple[Dict[Hashable, int], Dict[Hashable, Hashable]]:
+    """
+    Direction-optimizing level-synchronous breadth first search
+
+    :param graph: directed or undirected graph
+
+    :param source: hashable object; the source node
+
+    :param alpha: float; default is 14.  Expand bottom-up while the frontier's edges outnumber the unexplored edges
+    divided by alpha.
+
+    :param beta: float; default is 24.  Expand top-down again once the frontier has fewer nodes than the graph
+    divided by beta.
+
+    :return: 2 element tuple.  1st element is a dict keyed by node and values of its depth, with the source node at
+    depth 0.  2nd element is a dict keyed by node and its parent in the search tree.
+    """
+    node_id = graph.node_id(source)
+    parents = {}
+    node_label = graph.node_label
+    depths = {source: 0}
+    for depth, frontier in enumerate(_bfs_levels(graph, node_id, parents, alpha, beta), start=1):
+        for node in frontier:
+            depths[node_label(node)] = depth
+    parent_dict = {node_label(node): node_label(parent) for node, parent in parents.items()}
+    return depths, parent_dict
 
 
 def dfs(graph: GraphTypeHint, source: Hashable) -> Generator:
@@ -43,12 +129,23 @@ def dfs(graph: GraphTypeHint, source: Hashable) -> Generator:
 
     :return: generator
     """
-    return _search(graph, source, False)
+    adjacency = graph.id_adjacency()
+    node_label = graph.node_label
+    node_id = graph.node_id(source)
+    visited = {node_id}
+    stack = [neighbor for neighbor, _weight in adjacency[node_id]]
+    while stack:
+        curr_node = stack.pop()
+        if curr_node in visited:
+            continue
+        visited.add(curr_node)
+        yield node_label(curr_node)
+        stack.extend(neighbor for neighbor, _weight in adjacency[curr_node] if neighbor not in visited)
 
 
 def bfs(graph: GraphTypeHint, source: Hashable) -> Generator:
     """
-    Breadth first search algorithm
+    Breadth first search algorithm.  Nodes are generated level by level from bfs_levels' search.
 
     :param graph: directed or undirected graph
 
@@ -56,4 +153,29 @@ def bfs(graph: GraphTypeHint, source: Hashable) -> Generator:
 
     :return: generator
     """
-    return _search(graph, source, True)
+    node_label = graph.node_label
+    for frontier in _bfs_levels(graph, graph.node_id(source), {}):
+        yield from map(node_label, frontier)
+
+
+def bfs_shortest_path(graph: GraphTypeHint, u: Hashable) -> Tuple[Dict, Dict]:
+    """
+    Breadth first search for shortest paths on an unweighted graph, where every edge counts as distance 1.
+
+    :param graph: directed or undirected graph
+
+    :param u: hashable object; the source node
+
+    :return: 2 element tuple.  1st element is a dict keyed by the source-node / target-node tuple and values of the
+    distance to the source node.  2nd element is a dict keyed by the source-node / target-node tuple and its
+    previous node in the shortest path.
+    """
+    source = graph.node_id(u)
+    node_label = graph.node_label
+    prev = {}
+    distance_dict = {}
+    for distance, frontier in enumerate(_bfs_levels(graph, source, prev), start=1):
+        for node in frontier:
+            distance_dict[(u, node_label(node))] = distance
+    prev_dict = {(u, node_label(node)): node_label(prev_node) for node, prev_node in prev.items()}
+    return distance_dict, prev_dict
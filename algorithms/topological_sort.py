@@ -0,0 +1,103 @@
+
+from collections import deque
+from typing import Dict, Hashable, List, Set, Tuple
+
+from exceptions import CycleDetectedException
+import graph_cls as gc
+
+
+def _find_cycle(graph: gc.DiGraph, remaining_nodes: Set) -> List[Hashable]:
+    """
+    Helper function to find a cycle among the nodes left over by Kahn's algorithm.  Every leftover node has a
+    leftover predecessor, so walking backwards through predecessors must revisit a node.
+
+    :param graph: a directed graph
+
+    :param remaining_nodes: set of nodes that were never removed by Kahn's algorithm
+
+    :return: list of nodes forming a cycle, in edge order
+    """
+    predecessors = {}
+    for u, v in graph.edge_weights:
+        if (u in remaining_nodes) and (v in remaining_nodes):
+            predecessors[v] = u
+
+    curr_node = next(iter(remaining_nodes))
+    walk_index = {}
+    walk = []
+    while curr_node not in walk_index:
+        walk_index[curr_node] = len(walk)
+        walk.append(curr_node)
+        curr_node = predecessors[curr_node]
+    return walk[walk_index[curr_node]:][::-1]
+
+
+def _topological_order(graph: gc.DiGraph) -> Tuple[Hashable, ...]:
+    """
+    Helper function to get the topological order cached on the graph, sorting only if the graph changed since the
+    last call.
+
+    :param graph: a directed graph
+
+    :return: tuple of nodes in topological order.  Raise CycleDetectedException if the graph is not acyclic.
+    """
+    if not graph.is_directed:
+        raise TypeError('graph should be directed')
+    if graph._topological_cache is None:
+        try:
+            graph._topological_cache = (tuple(_kahn(graph)), None)
+        except CycleDetectedException as e:
+            graph._topological_cache = (None, e.cycle)
+    order, cycle = graph._topological_cache
+    if order is None:
+        raise CycleDetectedException(list(cycle))
+    return order
+
+
+def _kahn(graph: gc.DiGraph) -> List[Hashable]:
+    in_degree: Dict[Hashable, int] = dict.fromkeys(graph.g, 0)
+    for neighbors in graph.g.values():
+        for neighbor in neighbors:
+            in_degree[neighbor] += 1
+
+    queue = deque(node for node, degree in in_degree.items() if degree == 0)
+    order = []
+    while queue:
+        curr_node = queue.popleft()
+        order.append(curr_node)
+        for neighbor in graph.g[curr_node]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    if len(order) < len(graph):
+        raise CycleDetectedException(_find_cycle(graph, set(graph.g).difference(order)))
+    return order
+
+
+def topological_sort(graph: gc.DiGraph) -> List[Hashable]:
+    """
+    Perform Kahn's algorithm for topological sorting of a directed acyclic graph.  The result is cached on the graph
+    until a node or a new edge is added, or a node is removed.
+
+    :param graph: a directed graph
+
+    :return: list of nodes where every edge goes from an earlier node to a later node.  Raise CycleDetectedException
+    with one of the cycles if the graph is not acyclic.
+    """
+    return list(_topological_order(graph))
+
+
+def is_acyclic(graph: gc.DiGraph) -> bool:
+    """
+    Check if a directed graph is acyclic
+
+    :param graph: a directed graph
+
+    :return: bool; True if graph is a directed acyclic graph else False
+    """
+    try:
+        _topological_order(graph)
+    except CycleDetectedException:
+        return False
+    return True
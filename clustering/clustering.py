@@ -0,0 +1,180 @@
+
+from typing import Dict, Hashable, List, Tuple
+
+from graph_cls import Graph
+
+
+ClusteringDict = Dict[Hashable, float]
+
+
+def _degree(graph: Graph, node: Hashable) -> int:
+    return len(graph.g[node]) - (node in graph.g[node])
+
+
+def _degree_ordered_adjacency(graph: Graph) -> Tuple[List[Hashable], List[List[int]]]:
+    """
+    Helper function to orient every edge from the lower-ranked to the higher-ranked node, ranking nodes by degree.
+    Each triangle is then found exactly once, from its lowest-ranked node, and high-degree hubs keep short lists.
+
+    :param graph: an undirected graph
+
+    :return: 2 element tuple.  1st element is the list of nodes in rank order.  2nd element is a list indexed by rank
+    of the sorted ranks of the node's higher-ranked neighbors.
+    """
+    nodes = sorted(graph.g, key=lambda node: _degree(graph, node))
+    rank = {node: i for i, node in enumerate(nodes)}
+    adjacency = [
+        sorted(rank[neighbor] for neighbor in graph.g[node] if rank[neighbor] > i) for i, node in enumerate(nodes)
+    ]
+    return nodes, adjacency
+
+
+def _count_triangles(adjacency: List[List[int]]) -> List[int]:
+    counts = [0] * len(adjacency)
+    higher = [frozenset(neighbors) for neighbors in adjacency]
+    for u, neighbors in enumerate(adjacency):
+        u_higher = higher[u]
+        for v in neighbors:
+            common = u_higher.intersection(higher[v])
+            if common:
+                counts[u] += len(common)
+                counts[v] += len(common)
+                for w in common:
+                    counts[w] += 1
+    return counts
+
+
+# Largest adjacency bitmap, in bytes, used to look up closing edges; larger graphs search the sorted edge keys
+_MAX_BITMAP_BYTES = 1 << 26
+
+# Number of wedges built at once, which bounds the size of the temporary arrays
+_WEDGE_CHUNK_SIZE = 1 << 20
+
+
+def _count_triangles_numpy(adjacency: List[List[int]]) -> List[int]:
+    """
+    Helper function to count triangles with NumPy over the whole degree-ordered adjacency at once.  Every pair of
+    higher-ranked neighbors (v, w) of a node u with v < w is an oriented wedge.  The wedges are built with np.repeat
+    over the row offsets, a chunk at a time.  Each chunk's closing edges v-w are looked up together, in an adjacency
+    bitmap if it fits in _MAX_BITMAP_BYTES, else with np.searchsorted against the sorted edge keys.
+
+    :param adjacency: list indexed by rank of the sorted ranks of the node's higher-ranked neighbors
+
+    :return: list indexed by rank of the node's number of triangles
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError('use_numpy=True requires numpy') from e
+
+    n = len(adjacency)
+    degrees = np.fromiter((len(neighbors) for neighbors in adjacency), dtype=np.int64, count=n)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+    n_edges = int(offsets[-1])
+    counts = np.zeros(n, dtype=np.int64)
+    if not n_edges:
+        return counts.tolist()
+
+    targets = np.fromiter(
+        (neighbor for neighbors in adjacency for neighbor in neighbors), dtype=np.int64, count=n_edges
+    )
+    sources = np.repeat(np.arange(n, dtype=np.int64), degrees)
+    # Rows are sorted and sources ascend, so the edge keys are already sorted
+    edge_keys = sources * n + targets
+    bitmap = None
+    if n * n <= 8 * _MAX_BITMAP_BYTES:
+        bitmap = np.zeros((n * n + 7) // 8, dtype=np.uint8)
+        np.bitwise_or.at(bitmap, edge_keys >> 3, (128 >> (edge_keys & 7)).astype(np.uint8))
+
+    # Edge k = (u, v) pairs with every later entry of u's row, from position k + 1 to the end of the row
+    n_partners = offsets[1:][sources] - np.arange(1, n_edges + 1)
+    wedge_ends = np.cumsum(n_partners)
+    chunk_ends = np.searchsorted(wedge_ends, np.arange(_WEDGE_CHUNK_SIZE, wedge_ends[-1], _WEDGE_CHUNK_SIZE)) + 1
+    start = 0
+    for stop in [*chunk_ends.tolist(), n_edges]:
+        if stop <= start:
+            continue
+        chunk_partners = n_partners[start:stop]
+        first = np.repeat(np.arange(start, stop), chunk_partners)
+        # Position within the chunk minus the start of each edge's wedges, shifted to the entry after the edge
+        shift = np.cumsum(chunk_partners) - chunk_partners - np.arange(start + 1, stop + 1)
+        second = np.arange(len(first)) - np.repeat(shift, chunk_partners)
+
+        wedge_keys = targets[first] * n + targets[second]
+        if bitmap is not None:
+            closed = np.flatnonzero(bitmap[wedge_keys >> 3] & (128 >> (wedge_keys & 7)).astype(np.uint8))
+        else:
+            positions = np.minimum(np.searchsorted(edge_keys, wedge_keys), n_edges - 1)
+            closed = np.flatnonzero(edge_keys[positions] == wedge_keys)
+
+        closed_first = first[closed]
+        for corner in (sources[closed_first], targets[closed_first], targets[second[closed]]):
+            counts += np.bincount(corner, minlength=n)
+        start = stop
+    return counts.tolist()
+
+
+def triangles(graph: Graph, use_numpy: bool = False) -> Dict[Hashable, int]:
+    """
+    Count the triangles each node belongs to in an undirected graph.  Self-loops are ignored.
+
+    :param graph: an undirected graph
+
+    :param use_numpy: bool; default is False.  If True, count triangles with vectorized NumPy operations.
+
+    :return: dict keyed by node and its number of triangles
+    """
+    if graph.is_directed:
+        raise TypeError('graph must be undirected graph')
+    nodes, adjacency = _degree_ordered_adjacency(graph)
+    counts = _count_triangles_numpy(adjacency) if use_numpy else _count_triangles(adjacency)
+    return dict(zip(nodes, counts))
+
+
+def local_clustering(graph: Graph, use_numpy: bool = False) -> ClusteringDict:
+    """
+    Calculate the local clustering coefficient of nodes in an undirected graph: the fraction of pairs of neighbors
+    that are themselves connected.
+
+    :param graph: an undirected graph
+
+    :param use_numpy: bool; default is False.  If True, count triangles with vectorized NumPy operations.
+
+    :return: dict keyed by node and its clustering coefficient.  Nodes with fewer than 2 neighbors have 0.
+    """
+    clustering = {}
+    for node, n_triangles in triangles(graph, use_numpy).items():
+        degree = _degree(graph, node)
+        clustering[node] = 2 * n_triangles / (degree * (degree - 1)) if degree > 1 else 0
+    return clustering
+
+
+def average_clustering(graph: Graph, use_numpy: bool = False) -> float:
+    """
+    Calculate the mean local clustering coefficient over all nodes of an undirected graph.
+
+    :param graph: an undirected graph
+
+    :param use_numpy: bool; default is False.  If True, count triangles with vectorized NumPy operations.
+
+    :return: float
+    """
+    clustering = local_clustering(graph, use_numpy)
+    return sum(clustering.values()) / len(clustering) if clustering else 0
+
+
+def transitivity(graph: Graph, use_numpy: bool = False) -> float:
+    """
+    Calculate the global transitivity of an undirected graph: 3 times the number of triangles divided by the number
+    of connected triples.
+
+    :param graph: an undirected graph
+
+    :param use_numpy: bool; default is False.  If True, count triangles with vectorized NumPy operations.
+
+    :return: float
+    """
+    n_closed_triples = sum(triangles(graph, use_numpy).values())
+    n_triples = sum(degree * (degree - 1) // 2 for degree in (_degree(graph, node) for node in graph.g))
+    return n_closed_triples / n_triples if n_triples else 0
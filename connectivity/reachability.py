@@ -0,0 +1,256 @@
+
+import random
+import time
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from graph_cls import GraphTypeHint
+import graph_typing as gt
+
+
+def _strongly_connected_components(graph: GraphTypeHint) -> Tuple[List[int], int]:
+    """
+    Helper function to perform Tarjan's algorithm iteratively on node ids.  Components are numbered in reverse
+    topological order: every edge between components goes from a higher to a lower component number.
+
+    :param graph: Graph or DiGraph object
+
+    :return: 2-element tuple of a list indexed by node id of its component number, and the number of components
+    """
+    adjacency = graph.id_adjacency()
+    n = graph.id_capacity
+    index_of = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    component = [-1] * n
+    stack = []
+    n_components = 0
+    counter = 0
+
+    for root in map(graph.node_id, graph.g):
+        if index_of[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, i = work.pop()
+            if i == 0:
+                index_of[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = 1
+            neighbors = adjacency[node]
+            descended = False
+            while i < len(neighbors):
+                neighbor = neighbors[i][0]
+                i += 1
+                if index_of[neighbor] == -1:
+                    work.append((node, i))
+                    work.append((neighbor, 0))
+                    descended = True
+                    break
+                elif on_stack[neighbor]:
+                    low[node] = min(low[node], index_of[neighbor])
+            if descended:
+                continue
+
+            if low[node] == index_of[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component[member] = n_components
+                    if member == node:
+                        break
+                n_components += 1
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+    return component, n_components
+
+
+class ReachabilityIndex:
+    """
+    Class ReachabilityIndex for repeated reachability queries.  The index is built on the condensation of the graph
+    (its strongly connected components) and labels each component with a topological number and GRAIL-style interval
+    labels from randomized depth first traversals.  The labels answer most queries directly; the rest fall back to a
+    search over the condensation that the labels prune.
+    """
+    def __init__(self, graph: GraphTypeHint, n_traversals: int = 2, seed: Optional[int] = None):
+        """
+        Instantiate an object of class ReachabilityIndex and build the index.  The index registers itself as an
+        observer of the graph and is refreshed on the next query after a change that can affect reachability.
+
+        :param graph: Graph or DiGraph object
+
+        :param n_traversals: int; number of randomized traversals used for interval labels.  Default is 2.
+
+        :param seed: optional; int seed for the traversal order.  Default is None.
+        """
+        self.graph = graph
+        self.n_traversals = n_traversals
+        self.rng = random.Random(seed)
+        self.is_stale = True
+        self.build_time = 0.0
+        self.refresh()
+        graph.add_observer(self)
+
+    def close(self) -> None:
+        """
+        Stop tracking changes to the graph.
+
+        :return: None
+        """
+        self.graph.remove_observer(self)
+
+    def refresh(self) -> None:
+        """
+        Rebuild the index from the current graph.
+
+        :return: None
+        """
+        start_time = time.perf_counter()
+        component, n_components = _strongly_connected_components(self.graph)
+        adjacency = self.graph.id_adjacency()
+        successors: List[Set[int]] = [set() for _ in range(n_components)]
+        for node in map(self.graph.node_id, self.graph.g):
+            for neighbor, _weight in adjacency[node]:
+                if component[node] != component[neighbor]:
+                    successors[component[node]].add(component[neighbor])
+
+        self.component = component
+        self.successors = [list(components) for components in successors]
+        self.labels = [self._interval_labels(i == 0) for i in range(max(self.n_traversals, 1))]
+        self.is_stale = False
+        self.build_time = time.perf_counter() - start_time
+
+    def _shuffled_successors(self, c: int):
+        successors = self.successors[c]
+        return iter(self.rng.sample(successors, len(successors)))
+
+    def _interval_labels(self, tree_cover: bool) -> Tuple[List[int], List[int], Optional[List[int]]]:
+        """
+        Helper function to label components from one randomized post-order traversal of the condensation.
+
+        :param tree_cover: bool; if True, also compute the low end of each component's traversal subtree
+
+        :return: 3 element tuple of lists indexed by component.  1st element is the post-order rank.  2nd element is
+        the lowest rank among all descendants.  3rd element is the lowest rank in the traversal subtree, or None.
+        """
+        n_components = len(self.successors)
+        rank = [-1] * n_components
+        low = [0] * n_components
+        tree_low = [0] * n_components if tree_cover else None
+        roots = list(range(n_components))
+        self.rng.shuffle(roots)
+        counter = 0
+        for root in roots:
+            if rank[root] != -1:
+                continue
+            rank[root] = -2
+            work = [(root, self._shuffled_successors(root))]
+            subtree_low = [counter]
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if rank[child] == -1:
+                        rank[child] = -2
+                        work.append((child, self._shuffled_successors(child)))
+                        subtree_low.append(counter)
+                    continue
+                work.pop()
+                rank[node] = counter
+                low[node] = min([counter] + [low[child] for child in self.successors[node]])
+                node_subtree_low = subtree_low.pop()
+                if tree_cover:
+                    tree_low[node] = node_subtree_low
+                counter += 1
+        return rank, low, tree_low
+
+    def _may_reach(self, c: int, d: int) -> bool:
+        # Necessary conditions: topological order and interval containment in every traversal
+        if c < d:
+            return False
+        return all((low[c] <= low[d]) and (rank[d] <= rank[c]) for rank, low, _tree_low in self.labels)
+
+    def _must_reach(self, c: int, d: int) -> bool:
+        # Sufficient condition: d is in c's subtree of the first traversal
+        rank, _low, tree_low = self.labels[0]
+        return tree_low[c] <= rank[d] <= rank[c]
+
+    def reachable(self, u: Hashable, v: Hashable) -> bool:
+        """
+        Check if a path exists from u to v.  Most queries are answered by the labels alone; the rest search the
+        condensation with label pruning, see _search.
+
+        :param u: hashable object; the source node.
+
+        :param v: hashable object; the target node.
+
+        :return: bool.  Return True if a path exists from u to v, else False.
+        """
+        if self.is_stale:
+            self.refresh()
+        c = self.component[self.graph.node_id(u)]
+        d = self.component[self.graph.node_id(v)]
+        if c == d:
+            return True
+        if not self._may_reach(c, d):
+            return False
+        if self._must_reach(c, d):
+            return True
+        return self._search(c, d)
+
+    def _search(self, c: int, d: int) -> bool:
+        """
+        Helper function to search the condensation from component c for component d when the labels cannot decide.
+        As in GRAIL, every component is checked against the labels when it is first met: it ends the search if d is
+        in its traversal subtree, and it is only expanded if its intervals contain d's in every traversal.  Each
+        component is checked once, so a query costs at most O(k * (V + E)) on the condensation for k traversals, and
+        in practice only touches the components whose labels cannot rule out d.
+
+        :param c: int; the source component, which may reach d
+
+        :param d: int; the target component
+
+        :return: bool.  Return True if a path exists from c to d, else False.
+        """
+        checked = {c}
+        stack = [c]
+        while stack:
+            curr = stack.pop()
+            for child in self.successors[curr]:
+                if child in checked:
+                    continue
+                checked.add(child)
+                if (child == d) or self._must_reach(child, d):
+                    return True
+                if self._may_reach(child, d):
+                    stack.append(child)
+        return False
+
+    @property
+    def size(self) -> int:
+        # Number of integers stored: the component of each node and the labels of each component
+        n_labels = sum(len(values) for label in self.labels for values in label if values is not None)
+        return len(self.component) + n_labels
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            'n_components': len(self.successors),
+            'size': self.size,
+            'build_time': self.build_time
+        }
+
+    def node_added(self, node: Hashable) -> None:
+        self.is_stale = True
+
+    def node_removed(self, node: Hashable) -> None:
+        self.is_stale = True
+
+    def edge_added(self, u: Hashable, v: Hashable, weight: gt.Numeric, old_weight: gt.Numeric) -> None:
+        # An edge between nodes that are already connected in that direction adds no reachability
+        if (old_weight is None) and not self.is_stale and not self.reachable(u, v):
+            self.is_stale = True
+
+    def edge_removed(self, u: Hashable, v: Hashable, weight: gt.Numeric) -> None:
+        self.is_stale = True
@@ -1,4 +1,7 @@
 
+import random
+from typing import Optional
+
 from graph_cls import Graph, DiGraph, GraphTypeHint
 
 
@@ -59,3 +62,20 @@ def connected_component_graph() -> DiGraph:
         ('i', 'g'), ('i', 'h'), ('i', 'i')
     ]
     return DiGraph(edges=edges)
+
+
+def random_graph(
+        n_nodes: int, n_edges: int, is_directed: bool = False, max_weight: int = 1, seed: Optional[int] = None
+) -> GraphTypeHint:
+    # n_nodes integer nodes with n_edges random edges (without self-loops) and integer weights in [1, max_weight]
+    max_edges = n_nodes * (n_nodes - 1) if is_directed else n_nodes * (n_nodes - 1) // 2
+    if n_edges > max_edges:
+        raise ValueError(f'{n_nodes} nodes cannot hold {n_edges} edges without self-loops')
+    rng = random.Random(seed)
+    graph_type = DiGraph if is_directed else Graph
+    graph = graph_type(nodes=range(n_nodes))
+    while graph.size < n_edges:
+        u, v = rng.randrange(n_nodes), rng.randrange(n_nodes)
+        if (u != v) and ((u, v) not in graph.edge_weights):
+            graph.add_edge(u, v, rng.randint(1, max_weight))
+    return graph
@@ -1,5 +1,5 @@
 
-from typing import Hashable
+from typing import Hashable, List
 
 from graph_typing import Edge
 
@@ -26,3 +26,10 @@ class PathDoesNotExistException(BaseException):
 
     def __init__(self, u: Hashable, v: Hashable):
         super().__init__(f'Path does not exist between {u=} and {v=}')
+
+
+class CycleDetectedException(BaseException):
+
+    def __init__(self, cycle: List[Hashable]):
+        self.cycle = cycle
+        super().__init__(f'Graph contains a cycle: {cycle}')
@@ -1,8 +1,10 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from copy import deepcopy
-from typing import Hashable, Optional, Set, Union
+import heapq
+from typing import Hashable, Iterable, List, Optional, Sequence, Set, Tuple, Union
 import warnings
 
 import graph_typing as gt
@@ -88,12 +90,143 @@ class DiGraph:
         """
         self.g = {}
         self.edge_weights = {}
+        self._observers = []
+        # Incoming neighbors of each node, so remove_node does not scan the graph; g already holds them if undirected
+        self._predecessors = {} if self.is_directed else None
+
+        # Dense integer ids for nodes, so algorithms can keep their state in lists indexed by id
+        self._node_ids = {}
+        self._id_nodes = []
+        self._free_ids = []
+        self._id_adjacency = None
+
+        # Result of topological_sort as a 2-element tuple of the node order and a cycle, one of which is None.  Kept
+        # until a node or a new edge is added, or a node is removed; removing an edge keeps an order valid.
+        self._topological_cache = None
+
+        # Edge weight properties, kept current as edges are added and removed
+        self._weight_counts = Counter()
+        self._n_negative_edges = 0
+        self._n_unit_edges = 0
+        # Heaps of distinct weights for min_weight / max_weight; entries whose count dropped to 0 are popped lazily
+        self._min_weights = []
+        self._max_weights = []
 
         if nodes is not None:
             self.add_nodes_from(nodes)
 
         if edges is not None:
-            self.add_edges_from(edges)
+            self._bulk_add_edges(edges, deduplicate=True)
+
+    @classmethod
+    def from_iterable(
+            cls, edges: Iterable[gt.Edge], nodes: Optional[Iterable[Hashable]] = None, deduplicate: bool = True
+    ) -> DiGraph:
+        """
+        Build a graph from an iterable of edges in a single pass, without the per-edge method calls of add_edge.
+
+        :param edges: iterable of 2 or 3 element tuples, e.g. a generator.  Tuples should be 2 or 3 elements
+        where the first 2 elements are hashable objects representing the source node and the target node.  The 3rd
+        element is a numeric value representing the edge weight; defaults to edge weight of 1 if not supplied.
+
+        :param nodes: optional; iterable of hashable objects added as nodes before the edges.  Default is None.
+
+        :param deduplicate: bool; default is True.  If True, a repeated edge overwrites the earlier weight, as with
+        add_edge.  If False, raise ValueError if any edge is repeated.
+
+        :return: graph of the same class
+        """
+        graph = cls(nodes=nodes)
+        graph._bulk_add_edges(edges, deduplicate)
+        return graph
+
+    @classmethod
+    def from_edge_arrays(
+            cls, src: Sequence[Hashable], dst: Sequence[Hashable], weights: Optional[Sequence[gt.Numeric]] = None,
+            nodes: Optional[Iterable[Hashable]] = None, deduplicate: bool = True
+    ) -> DiGraph:
+        """
+        Build a graph from parallel arrays of source nodes, target nodes and edge weights in a single pass.
+
+        :param src: sequence of source nodes, e.g. a list, array.array, NumPy array or generator
+
+        :param dst: sequence of target nodes of the same length as src
+
+        :param weights: optional; sequence of edge weights of the same length as src.  Default is None, which gives
+        every edge a weight of 1.
+
+        :param nodes: optional; iterable of hashable objects added as nodes before the edges.  Default is None.
+
+        :param deduplicate: bool; default is True.  If True, a repeated edge overwrites the earlier weight, as with
+        add_edge.  If False, raise ValueError if any edge is repeated.
+
+        :return: graph of the same class.  Raise ValueError if the sequences differ in length.
+        """
+        # Arrays are converted to lists in one call so nodes and weights are plain Python objects
+        src, dst = [x.tolist() if hasattr(x, 'tolist') else x for x in (src, dst)]
+        if weights is None:
+            edges = zip(src, dst, strict=True)
+        else:
+            weights = weights.tolist() if hasattr(weights, 'tolist') else weights
+            edges = zip(src, dst, weights, strict=True)
+        return cls.from_iterable(edges, nodes=nodes, deduplicate=deduplicate)
+
+    def _bulk_add_edges(self, edges: Iterable[gt.Edge], deduplicate: bool) -> None:
+        """
+        Helper function to add edges by writing to g and edge_weights directly.  Observers are not notified, so this
+        is only used while building a new graph.
+
+        :param edges: iterable of 2 or 3 element tuples
+
+        :param deduplicate: bool; if False, raise ValueError if any edge is repeated
+
+        :return: None
+        """
+        g = self.g
+        edge_weights = self.edge_weights
+        is_directed = self.is_directed
+        n_existing_edges = len(edge_weights)
+        n_written = 0
+
+        for edge in edges:
+            if len(edge) == 2:
+                u, v = edge
+                weight = 1
+            else:
+                u, v, weight = edge
+            neighbors = g.get(u)
+            if neighbors is None:
+                neighbors = g[u] = set()
+            neighbors.add(v)
+            edge_weights[(u, v)] = weight
+            if is_directed:
+                if v not in g:
+                    g[v] = set()
+                predecessors = self._predecessors.get(v)
+                if predecessors is None:
+                    predecessors = self._predecessors[v] = set()
+                predecessors.add(u)
+                n_written += 1
+            elif u != v:
+                neighbors = g.get(v)
+                if neighbors is None:
+                    neighbors = g[v] = set()
+                neighbors.add(u)
+                edge_weights[(v, u)] = weight
+                n_written += 2
+            else:
+                n_written += 1
+
+        if not deduplicate and (len(edge_weights) - n_existing_edges != n_written):
+            raise ValueError('edges contain duplicates; pass deduplicate=True to keep the last weight')
+        self._reset_weight_properties()
+        for node in g:
+            if node not in self._node_ids:
+                self._intern(node)
+            if is_directed and (node not in self._predecessors):
+                self._predecessors[node] = set()
+        self._id_adjacency = None
+        self._topological_cache = None
 
     def __contains__(self, node: Hashable) -> bool:
         return node in self.g
@@ -109,6 +242,25 @@ class DiGraph:
         if node not in self:
             raise NodeNotInGraphException(node)
 
+    def _track_weight(self, weight: gt.Numeric) -> None:
+        self._weight_counts[weight] += 1
+        self._n_negative_edges += weight < 0
+        self._n_unit_edges += weight == 1
+        if self._weight_counts[weight] == 1:
+            heapq.heappush(self._min_weights, weight)
+            heapq.heappush(self._max_weights, -weight)
+            # Rebuild the heaps once stale entries of re-added weights outnumber the live ones
+            if len(self._min_weights) > 2 * len(self._weight_counts) + 16:
+                self._rebuild_weight_heaps()
+
+    def _untrack_weight(self, weight: gt.Numeric) -> None:
+        self._weight_counts[weight] -= 1
+        self._n_negative_edges -= weight < 0
+        self._n_unit_edges -= weight == 1
+        if not self._weight_counts[weight]:
+            # The weight stays in the heaps until it reaches the top of one
+            del self._weight_counts[weight]
+
     @property
     def size(self) -> int:
         return len(self.edge_weights)
@@ -135,7 +287,120 @@ class DiGraph:
 
     @property
     def is_weighted(self) -> bool:
-        return (min(self.edge_weights) == 1) and (max(self.edge_weights) == 1)
+        return self._n_unit_edges < len(self.edge_weights)
+
+    @property
+    def has_negative_weights(self) -> bool:
+        return self._n_negative_edges > 0
+
+    @property
+    def n_negative_edges(self) -> int:
+        return self._n_negative_edges
+
+    @property
+    def min_weight(self) -> Optional[gt.Numeric]:
+        min_weights = self._min_weights
+        while min_weights and (min_weights[0] not in self._weight_counts):
+            heapq.heappop(min_weights)
+        return min_weights[0] if min_weights else None
+
+    @property
+    def max_weight(self) -> Optional[gt.Numeric]:
+        max_weights = self._max_weights
+        while max_weights and (-max_weights[0] not in self._weight_counts):
+            heapq.heappop(max_weights)
+        return -max_weights[0] if max_weights else None
+
+    def _reset_weight_properties(self) -> None:
+        self._weight_counts = Counter(self.edge_weights.values())
+        self._n_negative_edges = sum(count for weight, count in self._weight_counts.items() if weight < 0)
+        self._n_unit_edges = self._weight_counts.get(1, 0)
+        self._rebuild_weight_heaps()
+
+    def _rebuild_weight_heaps(self) -> None:
+        self._min_weights = list(self._weight_counts)
+        heapq.heapify(self._min_weights)
+        self._max_weights = [-weight for weight in self._weight_counts]
+        heapq.heapify(self._max_weights)
+
+    def add_observer(self, observer) -> None:
+        """
+        Register an observer that is notified of changes to the graph.  The observer must implement the methods
+        node_added(node), node_removed(node), edge_added(u, v, weight, old_weight) and edge_removed(u, v, weight).
+        old_weight is None if the edge is new.  An observer may also implement check_edge(u, v, weight), which is
+        called before an edge is added or its weight changes and can reject the edge by raising an exception.
+
+        :param observer: object implementing the observer methods
+
+        :return: None
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer) -> None:
+        """
+        Stop notifying the observer of changes to the graph.
+
+        :param observer: a registered observer
+
+        :return: None
+        """
+        self._observers.remove(observer)
+
+    def _intern(self, node: Hashable) -> int:
+        if self._free_ids:
+            node_id = self._free_ids.pop()
+            self._id_nodes[node_id] = node
+        else:
+            node_id = len(self._id_nodes)
+            self._id_nodes.append(node)
+        self._node_ids[node] = node_id
+        return node_id
+
+    @property
+    def id_capacity(self) -> int:
+        return len(self._id_nodes)
+
+    def node_id(self, node: Hashable) -> int:
+        """
+        Get the dense integer id of the node.  Ids are in range(id_capacity); ids released by remove_node are reused.
+
+        :param node: hashable object
+
+        :return: int; the node id
+        """
+        self._assert_node_exists(node)
+        return self._node_ids[node]
+
+    def node_label(self, node_id: int) -> Hashable:
+        """
+        Get the node with the dense integer id.
+
+        :param node_id: int; the node id
+
+        :return: hashable object; the node
+        """
+        node = self._id_nodes[node_id]
+        # Released slots hold None; checking the id table also survives copying and pickling the graph
+        if self._node_ids.get(node) != node_id:
+            raise KeyError(f'Node id {node_id} is not in use')
+        return node
+
+    def id_adjacency(self) -> List[Tuple[Tuple[int, gt.Numeric], ...]]:
+        """
+        Get the adjacency of the graph in terms of node ids.  The result is cached until the graph changes.
+
+        :return: list indexed by node id of tuples of (neighbor id, edge weight) pairs.  Unused ids have no neighbors.
+        """
+        if self._id_adjacency is None:
+            node_ids = self._node_ids
+            edge_weights = self.edge_weights
+            adjacency = [()] * len(self._id_nodes)
+            for node, neighbors in self.g.items():
+                adjacency[node_ids[node]] = tuple(
+                    (node_ids[neighbor], edge_weights[(node, neighbor)]) for neighbor in neighbors
+                )
+            self._id_adjacency = adjacency
+        return self._id_adjacency
 
     def get_neighbors(self, node: Hashable) -> Set:
         """
@@ -157,6 +422,13 @@ class DiGraph:
         """
         if node not in self:
             self.g[node] = set()
+            if self._predecessors is not None:
+                self._predecessors[node] = set()
+            self._intern(node)
+            self._id_adjacency = None
+            self._topological_cache = None
+            for observer in self._observers:
+                observer.node_added(node)
 
     def add_nodes_from(self, nodes: gt.NodeCollection) -> None:
         """
@@ -181,10 +453,26 @@ class DiGraph:
 
         :return: None
         """
+        # Observers may reject the edge before the graph changes
+        for observer in self._observers:
+            check_edge = getattr(observer, 'check_edge', None)
+            if check_edge is not None:
+                check_edge(u, v, weight)
         self.add_node(u)
         self.add_node(v)
         self[u].add(v)
+        if self._predecessors is not None:
+            self._predecessors[v].add(u)
+        old_weight = self.edge_weights.get((u, v))
+        if old_weight is not None:
+            self._untrack_weight(old_weight)
         self.edge_weights[(u, v)] = weight
+        self._track_weight(weight)
+        self._id_adjacency = None
+        if old_weight is None:
+            self._topological_cache = None
+        for observer in self._observers:
+            observer.edge_added(u, v, weight, old_weight)
 
     def add_edges_from(self, edges: gt.EdgeCollection) -> None:
         """
@@ -209,8 +497,16 @@ class DiGraph:
 
         :return: None
         """
-        del self.edge_weights[(u, v)]
+        weight = self.edge_weights.pop((u, v))
+        self._untrack_weight(weight)
+        self._id_adjacency = None
+        if (self._topological_cache is not None) and (self._topological_cache[0] is None):
+            self._topological_cache = None
         self[u].remove(v)
+        if self._predecessors is not None:
+            self._predecessors[v].discard(u)
+        for observer in self._observers:
+            observer.edge_removed(u, v, weight)
 
     def remove_edges_from(self, edges: gt.EdgeCollection) -> None:
         """
@@ -234,7 +530,19 @@ class DiGraph:
         neighbors = self.get_neighbors(node)
         for neighbor in neighbors:
             self.remove_edge(node, neighbor)
+        # Removing an undirected edge already removes both directions
+        if self._predecessors is not None:
+            for predecessor in list(self._predecessors[node]):
+                self.remove_edge(predecessor, node)
+            del self._predecessors[node]
         del self.g[node]
+        node_id = self._node_ids.pop(node)
+        self._id_nodes[node_id] = None
+        self._free_ids.append(node_id)
+        self._id_adjacency = None
+        self._topological_cache = None
+        for observer in self._observers:
+            observer.node_removed(node)
 
     def remove_nodes_from(self, nodes: gt.NodeCollection) -> None:
         """
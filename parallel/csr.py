@@ -0,0 +1,86 @@
+
+from array import array
+from typing import Dict, Hashable, Iterator, List, Sequence, Tuple
+
+from graph_cls import GraphTypeHint
+from graph_typing import Numeric
+
+
+class CSRGraph:
+    """
+    Class CSRGraph for a compressed sparse row snapshot of a graph.  Nodes are numbered by their position in nodes;
+    the out-neighbors of node i are targets[offsets[i]:offsets[i + 1]] with the matching weights.
+    """
+    def __init__(self, nodes: List[Hashable], offsets: Sequence[int], targets: Sequence[int], weights: Sequence[float]):
+        """
+        Instantiate an object of class CSRGraph.  Use to_csr to create the snapshot from a graph.
+
+        :param nodes: list of hashable objects; the node labels
+
+        :param offsets: sequence of len(nodes) + 1 ints; start of each node's neighbors in targets
+
+        :param targets: sequence of ints; neighbor indices
+
+        :param weights: sequence of floats; edge weights matching targets
+        """
+        self.nodes = nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.index = {node: i for i, node in enumerate(nodes)}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def neighbors(self, i: int) -> Iterator[Tuple[int, Numeric]]:
+        """
+        Iterate over the out-neighbors of node i.
+
+        :param i: int; node index
+
+        :return: iterator of 2-element tuples of neighbor index and edge weight
+        """
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def to_labels(self, source: int, distances: Dict[int, Numeric], prev: Dict[int, int]) -> Tuple[Dict, Dict]:
+        """
+        Translate single-source results on node indices to the output format of djikstra.
+
+        :param source: int; the source node index
+
+        :param distances: dict keyed by node index and its distance from the source node
+
+        :param prev: dict keyed by node index and the index of its previous node in the shortest path
+
+        :return: 2 element tuple.  1st element is a dict keyed by the source-node / target-node tuple and values of the
+        distance to the source node.  2nd element is a dict keyed by the source-node / target-node tuple and its
+        previous node in the shortest path.
+        """
+        nodes = self.nodes
+        u = nodes[source]
+        distance_dict = {(u, nodes[i]): distance for i, distance in distances.items() if i != source}
+        prev_dict = {(u, nodes[i]): nodes[p] for i, p in prev.items()}
+        return distance_dict, prev_dict
+
+
+def to_csr(graph: GraphTypeHint) -> CSRGraph:
+    """
+    Create a compressed sparse row snapshot of the graph.
+
+    :param graph: Graph or DiGraph object
+
+    :return: CSRGraph
+    """
+    nodes = list(graph.g)
+    index = {node: i for i, node in enumerate(nodes)}
+    offsets = array('q', [0])
+    targets = array('q')
+    weights = array('d')
+    edge_weights = graph.edge_weights
+    for node in nodes:
+        for neighbor in graph.g[node]:
+            targets.append(index[neighbor])
+            weights.append(edge_weights[(node, neighbor)])
+        offsets.append(len(targets))
+    return CSRGraph(nodes, offsets, targets, weights)
@@ -0,0 +1,209 @@
+
+from __future__ import annotations
+
+from collections import deque
+import heapq
+from multiprocessing import Pool, shared_memory
+import pickle
+from typing import Callable, Collection, Dict, Hashable, Optional, Tuple
+
+from graph_cls import GraphTypeHint
+from parallel.csr import CSRGraph, to_csr
+
+
+class SharedCSR(CSRGraph):
+    """
+    Class SharedCSR for a compressed sparse row snapshot stored in shared memory.  Worker processes attach to the
+    buffers by name instead of receiving a pickled copy of the graph.
+    """
+    _array_codes = {'offsets': 'q', 'targets': 'q', 'weights': 'd'}
+
+    def __init__(self, blocks: Dict[str, shared_memory.SharedMemory], handle: Dict[str, Tuple[str, int]]):
+        """
+        Instantiate an object of class SharedCSR.  Use SharedCSR.from_graph to create the shared buffers or
+        SharedCSR.attach to attach to existing ones.
+
+        :param blocks: dict keyed by buffer name ('offsets', 'targets', 'weights', 'nodes') and its shared memory
+
+        :param handle: dict keyed by buffer name and a 2-element tuple of shared memory name and size in bytes
+        """
+        self.blocks = blocks
+        self.handle = handle
+        views = {
+            name: blocks[name].buf[:handle[name][1]].cast(code) for name, code in self._array_codes.items()
+        }
+        nodes = pickle.loads(blocks['nodes'].buf[:handle['nodes'][1]])
+        super().__init__(nodes, views['offsets'], views['targets'], views['weights'])
+
+    @classmethod
+    def from_graph(cls, graph: GraphTypeHint) -> SharedCSR:
+        """
+        Export the graph into shared memory buffers for the offsets, targets, weights and node table.
+
+        :param graph: Graph or DiGraph object
+
+        :return: SharedCSR owning the buffers.  Call unlink once every process is done with them.
+        """
+        csr = to_csr(graph)
+        payloads = {
+            'offsets': csr.offsets.tobytes(),
+            'targets': csr.targets.tobytes(),
+            'weights': csr.weights.tobytes(),
+            'nodes': pickle.dumps(csr.nodes)
+        }
+        blocks = {}
+        handle = {}
+        for name, payload in payloads.items():
+            # Shared memory blocks cannot be empty
+            block = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+            block.buf[:len(payload)] = payload
+            blocks[name] = block
+            handle[name] = (block.name, len(payload))
+        return cls(blocks, handle)
+
+    @classmethod
+    def attach(cls, handle: Dict[str, Tuple[str, int]]) -> SharedCSR:
+        """
+        Attach to buffers created by SharedCSR.from_graph without copying the arrays.
+
+        :param handle: the handle attribute of the SharedCSR that created the buffers
+
+        :return: SharedCSR
+        """
+        blocks = {name: shared_memory.SharedMemory(name=block_name) for name, (block_name, _size) in handle.items()}
+        return cls(blocks, handle)
+
+    def close(self) -> None:
+        """
+        Release this process's views of the buffers.
+
+        :return: None
+        """
+        for view in (self.offsets, self.targets, self.weights):
+            view.release()
+        for block in self.blocks.values():
+            block.close()
+
+    def unlink(self) -> None:
+        """
+        Release the views and free the buffers.  Only the process that created the buffers should call this.
+
+        :return: None
+        """
+        self.close()
+        for block in self.blocks.values():
+            block.unlink()
+
+    def __enter__(self) -> SharedCSR:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unlink()
+
+
+def csr_bfs(csr: CSRGraph, u: Hashable) -> Tuple[Dict, Dict]:
+    """
+    Perform breadth first search for unweighted shortest paths over a CSR snapshot.
+
+    :param csr: CSRGraph or SharedCSR
+
+    :param u: hashable object; the source node
+
+    :return: 2 element tuple in the output format of djikstra, with distances counted in edges
+    """
+    offsets = csr.offsets
+    targets = csr.targets
+    source = csr.index[u]
+    distances = {source: 0}
+    prev = {}
+    queue = deque([source])
+    while queue:
+        curr_node = queue.popleft()
+        distance = distances[curr_node] + 1
+        for neighbor in targets[offsets[curr_node]:offsets[curr_node + 1]]:
+            if neighbor not in distances:
+                distances[neighbor] = distance
+                prev[neighbor] = curr_node
+                queue.append(neighbor)
+    return csr.to_labels(source, distances, prev)
+
+
+def csr_djikstra(csr: CSRGraph, u: Hashable) -> Tuple[Dict, Dict]:
+    """
+    Perform Djikstra's Algorithm for Shortest Path over a CSR snapshot.
+
+    :param csr: CSRGraph or SharedCSR
+
+    :param u: hashable object; the source node
+
+    :return: 2 element tuple in the output format of djikstra
+    """
+    source = csr.index[u]
+    distances = {source: 0}
+    prev = {}
+    visited_nodes = set()
+    queue = [(0, source)]
+    while queue:
+        distance, curr_node = heapq.heappop(queue)
+        if curr_node in visited_nodes:
+            continue
+        visited_nodes.add(curr_node)
+        for neighbor, weight in csr.neighbors(curr_node):
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_distance
+                prev[neighbor] = curr_node
+                heapq.heappush(queue, (new_distance, neighbor))
+    return csr.to_labels(source, distances, prev)
+
+
+_worker_csr: Optional[SharedCSR] = None
+
+
+def _init_worker(handle: Dict[str, Tuple[str, int]]) -> None:
+    global _worker_csr
+    _worker_csr = SharedCSR.attach(handle)
+
+
+def _run_in_worker(args: Tuple[Callable, Hashable]):
+    func, source = args
+    return func(_worker_csr, source)
+
+
+def _merge(merged, result):
+    if merged is None:
+        return result
+    if isinstance(result, dict):
+        merged.update(result)
+    else:
+        for merged_part, part in zip(merged, result):
+            merged_part.update(part)
+    return merged
+
+
+def run_per_source(
+        graph: GraphTypeHint, func: Callable, sources: Optional[Collection[Hashable]] = None,
+        processes: Optional[int] = None
+):
+    """
+    Run a per-source function over a shared memory CSR snapshot of the graph in a process pool and merge the results.
+
+    :param graph: Graph or DiGraph object
+
+    :param func: module-level function taking a CSRGraph and a source node, e.g. csr_bfs or csr_djikstra.  It must
+    return a dict or a tuple of dicts.
+
+    :param sources: optional; collection of source nodes.  Default is None, which runs every node.
+
+    :param processes: optional; number of worker processes.  Default is None, which uses the CPU count.
+
+    :return: dict or tuple of dicts with the per-source results merged, e.g. all-pairs results in the output format
+    of floyd_warshall when func is csr_djikstra
+    """
+    sources = list(graph.g) if sources is None else list(sources)
+    merged = None
+    with SharedCSR.from_graph(graph) as csr:
+        with Pool(processes, initializer=_init_worker, initargs=(csr.handle,)) as pool:
+            for result in pool.imap_unordered(_run_in_worker, [(func, source) for source in sources], chunksize=16):
+                merged = _merge(merged, result)
+    return merged if merged is not None else ({}, {})
@@ -0,0 +1,114 @@
+
+import csv
+import pickle
+import struct
+from typing import Dict, Generator, Hashable, Iterable, List, Tuple
+
+from graph_cls import GraphTypeHint
+from paths.shortest_path import _single_source_algorithm
+
+
+Row = Tuple[Hashable, Dict, Dict]
+
+_MAGIC = b'APSP\x01'
+_HEADER = struct.Struct('<q')
+_ROW_HEADER = struct.Struct('<qq')
+_RECORD = struct.Struct('<qdq')
+
+
+def all_pairs_rows(graph: GraphTypeHint) -> Generator[Row, None, None]:
+    """
+    Generate all-pairs shortest path results one source row at a time, so peak memory is O(V) per row instead of the
+    O(V^2) result dicts of floyd_warshall.  The single-source algorithm is chosen as in shortest_path.
+
+    :param graph: Graph or DiGraph object
+
+    :return: generator of 3-element tuples.  1st element is the source node.  2nd element is a dict keyed by each
+    reachable target node and its distance from the source node.  3rd element is a dict keyed by each reachable
+    target node and its previous node in the shortest path.
+    """
+    single_source = _single_source_algorithm(graph)
+    for source in list(graph.g):
+        distance_dict, prev_dict = single_source(graph, source)
+        distances = {target: distance for (_source, target), distance in distance_dict.items()}
+        predecessors = {target: prev for (_source, target), prev in prev_dict.items()}
+        yield source, distances, predecessors
+
+
+def write_csv(rows: Iterable[Row], path: str) -> int:
+    """
+    Write all-pairs rows to a CSV file with columns source, target, distance and predecessor.  Rows are written as
+    they are generated.
+
+    :param rows: iterable of rows, e.g. from all_pairs_rows
+
+    :param path: str; path of the output file
+
+    :return: int; number of rows written
+    """
+    n_rows = 0
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['source', 'target', 'distance', 'predecessor'])
+        for source, distances, predecessors in rows:
+            writer.writerows(
+                (source, target, distance, predecessors[target]) for target, distance in distances.items()
+            )
+            n_rows += 1
+    return n_rows
+
+
+def write_binary(rows: Iterable[Row], path: str, nodes: List[Hashable]) -> int:
+    """
+    Write all-pairs rows to a compact binary file.  The file holds a pickled node table followed by one block per
+    row: the source index and record count, then a (target index, distance, predecessor index) record per target.
+
+    :param rows: iterable of rows, e.g. from all_pairs_rows
+
+    :param path: str; path of the output file
+
+    :param nodes: list of every node that appears in the rows
+
+    :return: int; number of rows written
+    """
+    index = {node: i for i, node in enumerate(nodes)}
+    node_table = pickle.dumps(list(nodes))
+    n_rows = 0
+    with open(path, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(_HEADER.pack(len(node_table)))
+        f.write(node_table)
+        for source, distances, predecessors in rows:
+            f.write(_ROW_HEADER.pack(index[source], len(distances)))
+            f.write(b''.join(
+                _RECORD.pack(index[target], distance, index[predecessors[target]])
+                for target, distance in distances.items()
+            ))
+            n_rows += 1
+    return n_rows
+
+
+def read_binary(path: str) -> Generator[Row, None, None]:
+    """
+    Read all-pairs rows written by write_binary, one row at a time.
+
+    :param path: str; path of the input file
+
+    :return: generator of rows in the format of all_pairs_rows.  Distances are read back as floats.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f'{path} is not an all-pairs binary file')
+        (table_size,) = _HEADER.unpack(f.read(_HEADER.size))
+        nodes = pickle.loads(f.read(table_size))
+        while True:
+            row_header = f.read(_ROW_HEADER.size)
+            if not row_header:
+                return
+            source, n_records = _ROW_HEADER.unpack(row_header)
+            distances = {}
+            predecessors = {}
+            for target, distance, prev in _RECORD.iter_unpack(f.read(n_records * _RECORD.size)):
+                distances[nodes[target]] = distance
+                predecessors[nodes[target]] = nodes[prev]
+            yield nodes[source], distances, predecessors
@@ -0,0 +1,320 @@
+
+from __future__ import annotations
+
+from collections import deque
+import heapq
+from itertools import count
+import time
+from typing import Collection, Dict, Hashable, List, Optional, Tuple
+
+from algorithms.djikstra import djikstra
+from exceptions import NodeNotInGraphException
+import graph_cls as gc
+from graph_typing import Numeric
+
+
+def _witness_distances(
+        out_edges: Dict, source: Hashable, excluded: Hashable, max_distance: Numeric, max_settled: int
+) -> Dict[Hashable, Numeric]:
+    """
+    Helper function to run a bounded Djikstra search from the source node that avoids the node being contracted.
+
+    :param out_edges: dict keyed by node and a dict of out-neighbors / edge weights of the remaining graph
+
+    :param source: hashable object; the source node
+
+    :param excluded: hashable object; the node being contracted
+
+    :param max_distance: numeric; stop once the next node is farther than this distance
+
+    :param max_settled: int; stop after settling this many nodes
+
+    :return: dict keyed by node and the tentative distance from the source node
+    """
+    tie_breaker = count()
+    distances = {source: 0}
+    settled = set()
+    queue = [(0, next(tie_breaker), source)]
+    while queue and (len(settled) < max_settled):
+        distance, _, curr_node = heapq.heappop(queue)
+        if distance > max_distance:
+            break
+        if curr_node in settled:
+            continue
+        settled.add(curr_node)
+        for neighbor, weight in out_edges[curr_node].items():
+            if neighbor == excluded:
+                continue
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_distance
+                heapq.heappush(queue, (new_distance, next(tie_breaker), neighbor))
+    return distances
+
+
+def _find_shortcuts(out_edges: Dict, in_edges: Dict, node: Hashable, max_settled: int) -> List[Tuple]:
+    """
+    Helper function to find the shortcuts required to contract the node.  A shortcut a-b is required when a-node-b is
+    the only shortest path from a to b found by the witness search.
+
+    :param out_edges: dict keyed by node and a dict of out-neighbors / edge weights of the remaining graph
+
+    :param in_edges: dict keyed by node and a dict of in-neighbors / edge weights of the remaining graph
+
+    :param node: hashable object; the node being contracted
+
+    :param max_settled: int; limit on the number of nodes settled per witness search
+
+    :return: list of 3-element tuples of source node, target node and shortcut weight
+    """
+    shortcuts = []
+    targets = out_edges[node]
+    if not targets:
+        return shortcuts
+    max_out_weight = max(targets.values())
+    for source, in_weight in in_edges[node].items():
+        witness = _witness_distances(out_edges, source, node, in_weight + max_out_weight, max_settled)
+        for target, out_weight in targets.items():
+            if target == source:
+                continue
+            weight = in_weight + out_weight
+            if witness.get(target, float('inf')) > weight:
+                shortcuts.append((source, target, weight))
+    return shortcuts
+
+
+class ContractionHierarchy:
+    """
+    Class ContractionHierarchy for answering repeated point-to-point shortest path queries on a static graph.
+    """
+    def __init__(
+            self, rank: Dict[Hashable, int], up_edges: Dict[Hashable, Dict], down_edges: Dict[Hashable, Dict],
+            middle: Dict[Tuple, Hashable], stats: Optional[Dict] = None
+    ):
+        """
+        Instantiate an object of class ContractionHierarchy.  Use ContractionHierarchy.build to create the hierarchy
+        from a graph.
+
+        :param rank: dict keyed by node and its contraction order
+
+        :param up_edges: dict keyed by node and a dict of higher-ranked out-neighbors / edge weights
+
+        :param down_edges: dict keyed by node and a dict of higher-ranked in-neighbors / edge weights
+
+        :param middle: dict keyed by the source-node / target-node tuple of each shortcut and the contracted node
+        it bypasses
+
+        :param stats: optional; dict of preprocessing statistics.  Default is None.
+        """
+        self.rank = rank
+        self.up_edges = up_edges
+        self.down_edges = down_edges
+        self.middle = middle
+        self.stats = stats if stats is not None else {}
+
+    @classmethod
+    def build(cls, graph: gc.GraphTypeHint, max_settled: int = 64) -> ContractionHierarchy:
+        """
+        Order the nodes by importance and contract them one at a time, adding shortcut edges that preserve shortest
+        path distances between the remaining nodes.
+
+        :param graph: Graph or DiGraph object.  Edge weights must be non-negative.
+
+        :param max_settled: int; limit on the number of nodes settled per witness search.  Default is 64.  Lower
+        values speed up preprocessing at the cost of extra shortcuts.
+
+        :return: ContractionHierarchy
+        """
+        if graph.has_negative_weights:
+            raise ValueError('graph must not contain negative edge weights')
+
+        start_time = time.perf_counter()
+        out_edges = {node: {} for node in graph.g}
+        in_edges = {node: {} for node in graph.g}
+        for (u, v), weight in graph.edge_weights.items():
+            if u != v:
+                out_edges[u][v] = weight
+                in_edges[v][u] = weight
+
+        contracted_neighbors = dict.fromkeys(graph.g, 0)
+
+        def importance(node: Hashable) -> int:
+            n_shortcuts = len(_find_shortcuts(out_edges, in_edges, node, max_settled))
+            edge_difference = n_shortcuts - len(in_edges[node]) - len(out_edges[node])
+            return edge_difference + contracted_neighbors[node]
+
+        tie_breaker = count()
+        queue = [(importance(node), next(tie_breaker), node) for node in graph.g]
+        heapq.heapify(queue)
+
+        rank = {}
+        up_edges = {}
+        down_edges = {}
+        middle = {}
+        n_shortcuts = 0
+        while queue:
+            _priority, _, node = heapq.heappop(queue)
+            # Lazy update: re-evaluate the node and defer it if it is no longer the least important
+            priority = importance(node)
+            if queue and (priority > queue[0][0]):
+                heapq.heappush(queue, (priority, next(tie_breaker), node))
+                continue
+
+            for source, target, weight in _find_shortcuts(out_edges, in_edges, node, max_settled):
+                if weight < out_edges[source].get(target, float('inf')):
+                    out_edges[source][target] = weight
+                    in_edges[target][source] = weight
+                    middle[(source, target)] = node
+                    n_shortcuts += 1
+
+            rank[node] = len(rank)
+            up_edges[node] = out_edges.pop(node)
+            down_edges[node] = in_edges.pop(node)
+            for neighbor in up_edges[node]:
+                del in_edges[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+            for neighbor in down_edges[node]:
+                del out_edges[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+
+        stats = {
+            'preprocessing_time': time.perf_counter() - start_time,
+            'n_shortcuts': n_shortcuts,
+            'n_edges': sum(len(edges) for edges in up_edges.values())
+        }
+        return cls(rank, up_edges, down_edges, middle, stats)
+
+    def _upward_search(self, edges: Dict[Hashable, Dict], source: Hashable) -> Tuple[Dict, Dict]:
+        """
+        Helper function to run Djikstra's algorithm on the upward graph from the source node.
+
+        :param edges: dict keyed by node and a dict of higher-ranked neighbors / edge weights
+
+        :param source: hashable object; the source node
+
+        :return: 2 element tuple.  1st element is a dict keyed by node and its distance from the source node.  2nd
+        element is a dict keyed by node and its previous node in the search tree.
+        """
+        tie_breaker = count()
+        distances = {source: 0}
+        prev = {}
+        settled = set()
+        queue = [(0, next(tie_breaker), source)]
+        while queue:
+            distance, _, curr_node = heapq.heappop(queue)
+            if curr_node in settled:
+                continue
+            settled.add(curr_node)
+            for neighbor, weight in edges[curr_node].items():
+                new_distance = distance + weight
+                if new_distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_distance
+                    prev[neighbor] = curr_node
+                    heapq.heappush(queue, (new_distance, next(tie_breaker), neighbor))
+        return distances, prev
+
+    def _unpack_edge(self, u: Hashable, v: Hashable) -> List[Hashable]:
+        """
+        Helper function to replace an edge of the hierarchy with the original edges it represents.
+
+        :param u: hashable object; the source node.
+
+        :param v: hashable object; the target node.
+
+        :return: list of nodes from u to v, excluding u
+        """
+        path = []
+        stack = [(u, v)]
+        while stack:
+            edge = stack.pop()
+            if edge in self.middle:
+                mid = self.middle[edge]
+                stack.append((mid, edge[1]))
+                stack.append((edge[0], mid))
+            else:
+                path.append(edge[1])
+        return path
+
+    def query(self, u: Hashable, v: Hashable) -> Tuple[List, Numeric]:
+        """
+        Find the shortest path from u to v with a bidirectional upward search.
+
+        :param u: hashable object; the source node.
+
+        :param v: hashable object; the target node.
+
+        :return: 2-element tuple of the path from u to v and its distance.  If no path exists, return an empty list
+        and float('inf').
+        """
+        for node in (u, v):
+            if node not in self.rank:
+                raise NodeNotInGraphException(node)
+        if u == v:
+            return [], float('inf')
+
+        forward_distances, forward_prev = self._upward_search(self.up_edges, u)
+        backward_distances, backward_prev = self._upward_search(self.down_edges, v)
+
+        meeting_node = None
+        best_distance = float('inf')
+        for node, distance in forward_distances.items():
+            total_distance = distance + backward_distances.get(node, float('inf'))
+            if total_distance < best_distance:
+                best_distance = total_distance
+                meeting_node = node
+        if meeting_node is None:
+            return [], float('inf')
+
+        upward_path = deque([meeting_node])
+        while upward_path[0] != u:
+            upward_path.appendleft(forward_prev[upward_path[0]])
+        downward_path = [meeting_node]
+        while downward_path[-1] != v:
+            downward_path.append(backward_prev[downward_path[-1]])
+
+        edges = list(zip(upward_path, list(upward_path)[1:])) + list(zip(downward_path, downward_path[1:]))
+        path = [u]
+        for edge in edges:
+            path.extend(self._unpack_edge(*edge))
+        return path, best_distance
+
+    def shortest_path(self, u: Hashable, v: Hashable) -> Dict[Tuple, Tuple]:
+        """
+        Find the shortest path from u to v.
+
+        :param u: hashable object; the source node.
+
+        :param v: hashable object; the target node.
+
+        :return: dict keyed by the source-node / target-node tuple and a 2-element tuple of the path and its distance,
+        in the same format as paths.shortest_path.shortest_path
+        """
+        return {(u, v): self.query(u, v)}
+
+    def benchmark(self, graph: gc.GraphTypeHint, pairs: Collection[Tuple]) -> Dict[str, Numeric]:
+        """
+        Time queries against the hierarchy and against Djikstra's algorithm on the original graph.
+
+        :param graph: Graph or DiGraph object the hierarchy was built from
+
+        :param pairs: collection of 2-element tuples of source node and target node
+
+        :return: dict of preprocessing statistics together with total query times and the query speedup
+        """
+        start_time = time.perf_counter()
+        for u, v in pairs:
+            self.query(u, v)
+        ch_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for u, _v in pairs:
+            djikstra(graph, u)
+        djikstra_time = time.perf_counter() - start_time
+
+        return {
+            **self.stats,
+            'n_queries': len(pairs),
+            'query_time': ch_time,
+            'djikstra_time': djikstra_time,
+            'speedup': djikstra_time / ch_time if ch_time else float('inf')
+        }
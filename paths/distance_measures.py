@@ -0,0 +1,175 @@
+
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import graph_cls as gc
+from graph_typing import Numeric
+from paths.landmarks import _distances_from
+from paths.shortest_path import _single_source_algorithm
+
+
+def _bounding_eccentricities(graph: gc.Graph, measure: str, nodes: Optional[Iterable[Hashable]] = None) -> Tuple:
+    """
+    Helper function to perform the bounding diameters algorithm.  Each traversal from a node v gives its exact
+    eccentricity e(v) and, for every other node w, the bounds max(e(v) - d(v, w), d(v, w)) <= e(w) <= e(v) + d(v, w).
+    Nodes are dropped once their eccentricity is known or can no longer change the requested measure, and the next
+    traversal alternates between the node with the largest upper bound and the node with the smallest lower bound.
+
+    :param graph: a connected undirected graph.  Edge weights must be non-negative.
+
+    :param measure: str; one of 'eccentricity', 'diameter', 'radius', 'center' or 'periphery'
+
+    :param nodes: optional; iterable of nodes whose eccentricity is needed for 'eccentricity'.  Default is None,
+    which uses every node.
+
+    :return: 3 element tuple.  1st element is a dict keyed by node and the lower bound of its eccentricity.  2nd
+    element is the same for the upper bound.  3rd element is the number of traversals.
+    """
+    if graph.is_directed:
+        raise TypeError('graph must be undirected graph')
+    if graph.has_negative_weights:
+        raise ValueError('graph must not contain negative edge weights')
+    if not graph.order:
+        raise ValueError('graph must contain at least one node')
+
+    single_source = _single_source_algorithm(graph)
+    lower = dict.fromkeys(graph.g, 0)
+    upper = dict.fromkeys(graph.g, float('inf'))
+    if nodes is None:
+        candidates = set(graph.g)
+    else:
+        candidates = set()
+        for node in nodes:
+            graph._assert_node_exists(node)
+            candidates.add(node)
+
+    n_traversals = 0
+    pick_upper = True
+    while candidates:
+        if pick_upper:
+            source = max(candidates, key=lambda node: (upper[node], len(graph.g[node])))
+        else:
+            source = min(candidates, key=lambda node: (lower[node], -len(graph.g[node])))
+        pick_upper = not pick_upper
+
+        distances = _distances_from(graph, source, single_source)
+        if len(distances) < graph.order:
+            raise ValueError('graph must be connected')
+        n_traversals += 1
+        source_eccentricity = max(distances.values())
+        lower[source] = upper[source] = source_eccentricity
+        for node, distance in distances.items():
+            lower[node] = max(lower[node], source_eccentricity - distance, distance)
+            upper[node] = min(upper[node], source_eccentricity + distance)
+
+        candidates = _prune(candidates, lower, upper, measure)
+    return lower, upper, n_traversals
+
+
+def _prune(candidates: Set, lower: Dict, upper: Dict, measure: str) -> Set:
+    """
+    Helper function to drop the candidate nodes that cannot change the requested measure.
+
+    :param candidates: set of nodes whose eccentricity may still be needed
+
+    :param lower: dict keyed by node and the lower bound of its eccentricity
+
+    :param upper: dict keyed by node and the upper bound of its eccentricity
+
+    :param measure: str; one of 'eccentricity', 'diameter', 'radius', 'center' or 'periphery'
+
+    :return: set of remaining candidate nodes
+    """
+    diameter_low = max(lower.values())
+    diameter_high = max(upper.values())
+    radius_low = min(lower.values())
+    radius_high = min(upper.values())
+
+    remaining = set()
+    for node in candidates:
+        if lower[node] == upper[node]:
+            continue
+        if measure == 'diameter':
+            # Its eccentricity cannot exceed the diameter found, and a traversal from it cannot tighten the upper bound
+            if (upper[node] <= diameter_low) and (2 * lower[node] >= diameter_high):
+                continue
+        elif measure == 'radius':
+            if (lower[node] >= radius_high) and (upper[node] <= 2 * radius_low):
+                continue
+        elif measure == 'center':
+            if lower[node] > radius_high:
+                continue
+        elif measure == 'periphery':
+            if upper[node] < diameter_low:
+                continue
+        remaining.add(node)
+
+    if measure == 'diameter' and diameter_low == diameter_high:
+        return set()
+    if measure == 'radius' and radius_low == radius_high:
+        return set()
+    return remaining
+
+
+def eccentricity(graph: gc.Graph, nodes: Optional[Iterable[Hashable]] = None) -> Tuple[Dict[Hashable, Numeric], int]:
+    """
+    Find the eccentricity of nodes, the largest distance from the node to any other node.
+
+    :param graph: a connected undirected graph.  Edge weights must be non-negative.
+
+    :param nodes: optional; iterable of nodes.  Default is None, which uses every node.
+
+    :return: 2-element tuple of a dict keyed by node and its eccentricity, and the number of traversals
+    """
+    nodes = list(graph.g) if nodes is None else list(nodes)
+    lower, _upper, n_traversals = _bounding_eccentricities(graph, 'eccentricity', nodes)
+    return {node: lower[node] for node in nodes}, n_traversals
+
+
+def diameter(graph: gc.Graph) -> Tuple[Numeric, int]:
+    """
+    Find the diameter of a graph, the largest eccentricity of any node.
+
+    :param graph: a connected undirected graph.  Edge weights must be non-negative.
+
+    :return: 2-element tuple of the diameter and the number of traversals
+    """
+    lower, _upper, n_traversals = _bounding_eccentricities(graph, 'diameter')
+    return max(lower.values()), n_traversals
+
+
+def radius(graph: gc.Graph) -> Tuple[Numeric, int]:
+    """
+    Find the radius of a graph, the smallest eccentricity of any node.
+
+    :param graph: a connected undirected graph.  Edge weights must be non-negative.
+
+    :return: 2-element tuple of the radius and the number of traversals
+    """
+    _lower, upper, n_traversals = _bounding_eccentricities(graph, 'radius')
+    return min(upper.values()), n_traversals
+
+
+def center(graph: gc.Graph) -> Tuple[List[Hashable], int]:
+    """
+    Find the center of a graph, the nodes whose eccentricity equals the radius.
+
+    :param graph: a connected undirected graph.  Edge weights must be non-negative.
+
+    :return: 2-element tuple of the list of center nodes and the number of traversals
+    """
+    lower, upper, n_traversals = _bounding_eccentricities(graph, 'center')
+    graph_radius = min(upper.values())
+    return [node for node in graph.g if lower[node] == upper[node] == graph_radius], n_traversals
+
+
+def periphery(graph: gc.Graph) -> Tuple[List[Hashable], int]:
+    """
+    Find the periphery of a graph, the nodes whose eccentricity equals the diameter.
+
+    :param graph: a connected undirected graph.  Edge weights must be non-negative.
+
+    :return: 2-element tuple of the list of periphery nodes and the number of traversals
+    """
+    lower, upper, n_traversals = _bounding_eccentricities(graph, 'periphery')
+    graph_diameter = max(lower.values())
+    return [node for node in graph.g if lower[node] == upper[node] == graph_diameter], n_traversals
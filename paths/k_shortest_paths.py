@@ -0,0 +1,159 @@
+
+import heapq
+from itertools import count
+from typing import Dict, Generator, Hashable, Iterator, List, Set, Tuple
+
+from algorithms.djikstra import djikstra
+import graph_cls as gc
+from graph_typing import Numeric
+
+
+class _MaskedView:
+    """
+    Read-only view of a graph that hides blocked nodes and edges without copying the graph.
+    """
+    def __init__(self, graph: gc.GraphTypeHint, blocked_nodes: Set, blocked_edges: Set):
+        self.graph = graph
+        self.blocked_nodes = blocked_nodes
+        self.blocked_edges = blocked_edges
+
+    def is_blocked(self, u: Hashable, v: Hashable) -> bool:
+        return (v in self.blocked_nodes) or ((u, v) in self.blocked_edges)
+
+    def neighbors(self, node: Hashable) -> Iterator[Hashable]:
+        return (neighbor for neighbor in self.graph.g[node] if not self.is_blocked(node, neighbor))
+
+
+def _path_cost(graph: gc.GraphTypeHint, path: List) -> Numeric:
+    return sum(graph.edge_weights[edge] for edge in zip(path, path[1:]))
+
+
+def _tree_path(next_hop: Dict, source: Hashable, v: Hashable) -> List:
+    """
+    Helper function to follow the shortest path tree rooted at the target node.
+
+    :param next_hop: dict keyed by node and the next node on its shortest path to the target node
+
+    :param source: hashable object; the first node of the path
+
+    :param v: hashable object; the target node
+
+    :return: list of nodes from the source node to the target node
+    """
+    path = [source]
+    while path[-1] != v:
+        path.append(next_hop[path[-1]])
+    return path
+
+
+def _spur_path(
+        view: _MaskedView, spur_node: Hashable, v: Hashable, to_target: Dict, next_hop: Dict
+) -> Tuple[List, Numeric]:
+    """
+    Helper function to find the shortest path from the spur node to the target node in the masked view.  The
+    distances to the target node in the unmasked graph are admissible A* estimates, and the unmasked tree path is
+    returned as is when the mask does not touch it.
+
+    :param view: _MaskedView of the graph
+
+    :param spur_node: hashable object; the first node of the spur path
+
+    :param v: hashable object; the target node
+
+    :param to_target: dict keyed by node and its distance to the target node in the unmasked graph
+
+    :param next_hop: dict keyed by node and the next node on its shortest path to the target node
+
+    :return: 2-element tuple of the spur path and its distance.  If no path exists, return an empty list and
+    float('inf').
+    """
+    if spur_node not in to_target:
+        return [], float('inf')
+
+    tree_path = _tree_path(next_hop, spur_node, v)
+    if not any(view.is_blocked(*edge) for edge in zip(tree_path, tree_path[1:])):
+        return tree_path, to_target[spur_node]
+
+    tie_breaker = count()
+    distances = {spur_node: 0}
+    prev = {}
+    closed = set()
+    queue = [(to_target[spur_node], next(tie_breaker), spur_node)]
+    while queue:
+        _estimate, _, curr_node = heapq.heappop(queue)
+        if curr_node == v:
+            path = [v]
+            while path[-1] != spur_node:
+                path.append(prev[path[-1]])
+            return path[::-1], distances[v]
+        if curr_node in closed:
+            continue
+        closed.add(curr_node)
+        for neighbor in view.neighbors(curr_node):
+            if neighbor not in to_target:
+                continue
+            distance = distances[curr_node] + view.graph.edge_weights[(curr_node, neighbor)]
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                prev[neighbor] = curr_node
+                heapq.heappush(queue, (distance + to_target[neighbor], next(tie_breaker), neighbor))
+    return [], float('inf')
+
+
+def k_shortest_paths(graph: gc.GraphTypeHint, u: Hashable, v: Hashable) -> Generator:
+    """
+    Generate loopless paths from u to v in order of increasing distance with Yen's algorithm.  Paths are computed
+    lazily, so consuming only the first k paths only pays for k paths.
+
+    :param graph: Graph or DiGraph object.  Edge weights must be non-negative.
+
+    :param u: hashable object; the source node.
+
+    :param v: hashable object; the target node.
+
+    :return: generator of 2-element tuples of the path and its distance
+    """
+    graph._assert_node_exists(u)
+    graph._assert_node_exists(v)
+    if graph.has_negative_weights:
+        raise ValueError('graph must not contain negative edge weights')
+    if u == v:
+        return
+
+    # Shortest path tree into the target node, shared by every spur search
+    reversed_graph = gc.to_reversed(graph) if graph.is_directed else graph
+    distance_dict, prev_dict = djikstra(reversed_graph, v)
+    to_target = {node: distance for (_v, node), distance in distance_dict.items()}
+    to_target[v] = 0
+    next_hop = {node: prev for (_v, node), prev in prev_dict.items()}
+    if u not in to_target:
+        return
+
+    accepted = [_tree_path(next_hop, u, v)]
+    yield accepted[0], to_target[u]
+
+    tie_breaker = count()
+    candidates = []
+    seen_paths = {tuple(accepted[0])}
+    while True:
+        prev_path = accepted[-1]
+        for i in range(len(prev_path) - 1):
+            root_path = prev_path[:i + 1]
+            blocked_edges = {
+                (path[i], path[i + 1]) for path in accepted if path[:i + 1] == root_path
+            }
+            view = _MaskedView(graph, set(root_path[:-1]), blocked_edges)
+            spur_path, spur_distance = _spur_path(view, root_path[-1], v, to_target, next_hop)
+            if not spur_path:
+                continue
+            path = root_path[:-1] + spur_path
+            if tuple(path) not in seen_paths:
+                seen_paths.add(tuple(path))
+                distance = _path_cost(graph, root_path) + spur_distance
+                heapq.heappush(candidates, (distance, next(tie_breaker), path))
+
+        if not candidates:
+            return
+        distance, _, path = heapq.heappop(candidates)
+        accepted.append(path)
+        yield path, distance
@@ -0,0 +1,199 @@
+
+from __future__ import annotations
+
+import pickle
+from typing import Callable, Dict, Hashable, List, Tuple
+
+from algorithms.djikstra import djikstra
+import graph_cls as gc
+from graph_typing import Numeric
+
+
+def _distances_from(
+        graph: gc.GraphTypeHint, source: Hashable, single_source: Callable = djikstra
+) -> Dict[Hashable, Numeric]:
+    """
+    Helper function to get the distances from the source node to every reachable node, including itself.
+
+    :param graph: Graph or DiGraph object
+
+    :param source: hashable object; the source node
+
+    :param single_source: function returning distances in the output format of djikstra.  Default is djikstra.
+
+    :return: dict keyed by node and its distance from the source node
+    """
+    distance_dict, _prev_dict = single_source(graph, source)
+    distances = {target: distance for (_source, target), distance in distance_dict.items()}
+    distances[source] = 0
+    return distances
+
+
+def _select_by_degree(graph: gc.GraphTypeHint, k: int) -> List[Hashable]:
+    """
+    Helper function to select the k nodes with the highest out-degree as landmarks.
+
+    :param graph: Graph or DiGraph object
+
+    :param k: int; number of landmarks
+
+    :return: list of landmark nodes
+    """
+    return sorted(graph.g, key=lambda node: len(graph.g[node]), reverse=True)[:k]
+
+
+def _select_farthest(graph: gc.GraphTypeHint, k: int) -> List[Hashable]:
+    """
+    Helper function to select k landmarks by farthest-point selection.  Each new landmark is the node whose distance
+    to the closest landmark already selected is the largest.  Nodes unreachable from every landmark are preferred, so
+    every component receives a landmark before any component receives a second one.
+
+    :param graph: Graph or DiGraph object
+
+    :param k: int; number of landmarks
+
+    :return: list of landmark nodes
+    """
+    start = _select_by_degree(graph, 1)[0]
+    closest = _distances_from(graph, start)
+    landmarks = []
+    min_distance = dict.fromkeys(graph.g, float('inf'))
+    while len(landmarks) < k:
+        if landmarks:
+            candidate = max(min_distance, key=min_distance.get)
+        else:
+            candidate = max(closest, key=closest.get)
+        landmarks.append(candidate)
+        for node, distance in _distances_from(graph, candidate).items():
+            if distance < min_distance[node]:
+                min_distance[node] = distance
+        min_distance[candidate] = -1
+    return landmarks
+
+
+class LandmarkIndex:
+    """
+    Class LandmarkIndex for precomputed landmark distances used by ALT (A*, Landmarks, Triangle inequality) queries.
+    """
+    selection_methods = {'farthest': _select_farthest, 'degree': _select_by_degree}
+
+    def __init__(self, landmarks: List[Hashable], forward: Dict[Hashable, Dict], backward: Dict[Hashable, Dict]):
+        """
+        Instantiate an object of class LandmarkIndex.  Use LandmarkIndex.build to create the index from a graph.
+
+        :param landmarks: list of landmark nodes
+
+        :param forward: dict keyed by landmark and a dict of distances from the landmark to each node as values
+
+        :param backward: dict keyed by landmark and a dict of distances from each node to the landmark as values
+        """
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+
+    @classmethod
+    def build(cls, graph: gc.GraphTypeHint, k: int = 8, method: str = 'farthest') -> LandmarkIndex:
+        """
+        Select k landmarks and precompute the distances from and to each of them with Djikstra's algorithm.
+
+        :param graph: Graph or DiGraph object.  Edge weights must be non-negative.
+
+        :param k: int; number of landmarks.  Default is 8.  Capped at the order of the graph.
+
+        :param method: str; landmark selection method, either 'farthest' or 'degree'.  Default is 'farthest'.
+
+        :return: LandmarkIndex
+        """
+        if method not in cls.selection_methods:
+            raise ValueError(f'method must be one of {sorted(cls.selection_methods)}')
+        if graph.has_negative_weights:
+            raise ValueError('graph must not contain negative edge weights')
+
+        k = min(k, graph.order)
+        landmarks = cls.selection_methods[method](graph, k) if k else []
+
+        reversed_graph = gc.to_reversed(graph) if graph.is_directed else graph
+        forward = {landmark: _distances_from(graph, landmark) for landmark in landmarks}
+        backward = {landmark: _distances_from(reversed_graph, landmark) for landmark in landmarks}
+        return cls(landmarks, forward, backward)
+
+    def lower_bound(self, u: Hashable, v: Hashable) -> Numeric:
+        """
+        Get a lower bound on the distance from u to v using the triangle inequality over every landmark.
+
+        :param u: hashable object; the source node.
+
+        :param v: hashable object; the target node.
+
+        :return: numeric value; float('inf') if the landmarks prove no path exists.
+        """
+        inf = float('inf')
+        bound = 0
+        for landmark in self.landmarks:
+            from_landmark = self.forward[landmark]
+            to_landmark = self.backward[landmark]
+
+            # d(L, v) <= d(L, u) + d(u, v)
+            if u in from_landmark:
+                if v not in from_landmark:
+                    return inf
+                bound = max(bound, from_landmark[v] - from_landmark[u])
+
+            # d(u, L) <= d(u, v) + d(v, L)
+            if v in to_landmark:
+                if u not in to_landmark:
+                    return inf
+                bound = max(bound, to_landmark[u] - to_landmark[v])
+        return bound
+
+    def upper_bound(self, u: Hashable, v: Hashable) -> Numeric:
+        """
+        Get an upper bound on the distance from u to v from the shortest detour through a landmark.
+
+        :param u: hashable object; the source node.
+
+        :param v: hashable object; the target node.
+
+        :return: numeric value; float('inf') if no landmark lies on a path from u to v.
+        """
+        inf = float('inf')
+        bound = 0 if u == v else inf
+        for landmark in self.landmarks:
+            bound = min(bound, self.backward[landmark].get(u, inf) + self.forward[landmark].get(v, inf))
+        return bound
+
+    def estimate(self, u: Hashable, v: Hashable) -> Tuple[Numeric, Numeric]:
+        """
+        Get the lower and upper bounds on the distance from u to v.
+
+        :param u: hashable object; the source node.
+
+        :param v: hashable object; the target node.
+
+        :return: 2-element tuple of the lower bound and the upper bound
+        """
+        return self.lower_bound(u, v), self.upper_bound(u, v)
+
+    def save(self, path: str) -> None:
+        """
+        Serialize the precomputed tables to a file.
+
+        :param path: str; path of the output file
+
+        :return: None
+        """
+        with open(path, 'wb') as f:
+            pickle.dump((self.landmarks, self.forward, self.backward), f)
+
+    @classmethod
+    def load(cls, path: str) -> LandmarkIndex:
+        """
+        Load precomputed tables written by LandmarkIndex.save.
+
+        :param path: str; path of the input file
+
+        :return: LandmarkIndex
+        """
+        with open(path, 'rb') as f:
+            landmarks, forward, backward = pickle.load(f)
+        return cls(landmarks, forward, backward)
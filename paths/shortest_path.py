@@ -1,11 +1,18 @@
 
 from collections import deque
-from typing import Dict, Hashable, Tuple, List, Optional
+import heapq
+from itertools import count
+from typing import Callable, Dict, Hashable, Iterable, Tuple, List, Optional, Union
 
-from algorithms.djikstra import djikstra
+from algorithms.bellman_ford import bellman_ford
+from algorithms.dag import dag_shortest_path
+from algorithms.djikstra import djikstra, multi_source_djikstra
 from algorithms.floyd_warshall import floyd_warshall
+from algorithms.search import bfs_shortest_path
+from algorithms.topological_sort import is_acyclic
 from graph_typing import Numeric
 from graph_cls import GraphTypeHint
+from paths.landmarks import LandmarkIndex
 
 
 def _shortest_path(distance_dict: Dict, prev_dict: Dict, u: Hashable, v: Hashable) -> Tuple[List, Numeric]:
@@ -21,12 +28,117 @@ def _shortest_path(distance_dict: Dict, prev_dict: Dict, u: Hashable, v: Hashabl
     return list(path), distance
 
 
+def _single_source_algorithm(graph: GraphTypeHint) -> Callable:
+    """
+    Helper function to pick the cheapest single-source shortest path algorithm that is correct for the graph, based on
+    the edge weight properties the graph tracks.
+
+    :param graph: Graph or DiGraph object
+
+    :return: single-source shortest path function with the same signature and output format as djikstra
+    """
+    if not graph.is_weighted:
+        return bfs_shortest_path
+    # Directed acyclic graphs are solved in linear time by relaxing edges in topological order
+    if graph.is_directed and is_acyclic(graph):
+        return dag_shortest_path
+    if graph.has_negative_weights:
+        return bellman_ford
+    return djikstra
+
+
+def _all_pairs(graph: GraphTypeHint, single_source: Callable) -> Tuple[Dict, Dict]:
+    distance_dict = {}
+    prev_dict = {}
+    for source in graph.g:
+        source_distance_dict, source_prev_dict = single_source(graph, source)
+        distance_dict.update(source_distance_dict)
+        distance_dict[(source, source)] = 0
+        prev_dict.update(source_prev_dict)
+    return distance_dict, prev_dict
+
+
 def shortest_path(graph: GraphTypeHint, u: Optional[Hashable], v: Optional[Hashable]) -> Dict[Tuple, Tuple]:
     if (u is None) and (v is not None):
         raise ValueError('u cannot be None while v is not None')
-    distance_dict, prev_dict = floyd_warshall(graph) if (u is None) and (v is None) else djikstra(graph, u)
+
+    single_source = _single_source_algorithm(graph)
+    if u is not None:
+        distance_dict, prev_dict = single_source(graph, u)
+    elif single_source in (bfs_shortest_path, dag_shortest_path):
+        distance_dict, prev_dict = _all_pairs(graph, single_source)
+    else:
+        distance_dict, prev_dict = floyd_warshall(graph)
 
     if (u is not None) and (v is not None):
         return {(u, v): _shortest_path(distance_dict, prev_dict, u, v)}
     else:
         return {edge: _shortest_path(distance_dict, prev_dict, *edge) for edge in distance_dict.keys()}
+
+
+def nearest_source(
+        graph: GraphTypeHint, sources: Union[Iterable[Hashable], Dict[Hashable, Numeric]]
+) -> Dict[Tuple, Tuple]:
+    """
+    Assign every reachable node to its nearest source node with a single multi-source Djikstra search, e.g. to
+    assign customers to their nearest warehouse.
+
+    :param graph: Graph or DiGraph object.  Edge weights must be non-negative.
+
+    :param sources: iterable of source nodes, or dict keyed by source node and a starting distance added to every
+    path from it
+
+    :return: dict keyed by the nearest-source / node tuple and a 2-element tuple of the path and its distance.  A
+    source node that is its own nearest source has a path of just itself.
+    """
+    if graph.has_negative_weights:
+        raise ValueError('graph must not contain negative edge weights')
+    distance_dict, prev_dict = multi_source_djikstra(graph, sources)
+    return {
+        (source, node): ([node], distance) if source == node else _shortest_path(distance_dict, prev_dict, source, node)
+        for (source, node), distance in distance_dict.items()
+    }
+
+
+def alt_shortest_path(graph: GraphTypeHint, u: Hashable, v: Hashable, landmarks: LandmarkIndex) -> Dict[Tuple, Tuple]:
+    """
+    Find the shortest path from u to v with A* search guided by landmark lower bounds (ALT).
+
+    :param graph: Graph or DiGraph object.  Must be the graph the landmark index was built from.
+
+    :param u: hashable object; the source node.
+
+    :param v: hashable object; the target node.
+
+    :param landmarks: LandmarkIndex built from the graph
+
+    :return: dict keyed by the source-node / target-node tuple and a 2-element tuple of the path and its distance,
+    in the same format as shortest_path
+    """
+    graph._assert_node_exists(u)
+    graph._assert_node_exists(v)
+
+    tie_breaker = count()
+    distances = {u: 0}
+    prev = {}
+    closed = set()
+    queue = [(landmarks.lower_bound(u, v), next(tie_breaker), u)]
+    while queue:
+        _estimate, _, curr_node = heapq.heappop(queue)
+        if curr_node == v:
+            break
+        if curr_node in closed:
+            continue
+        closed.add(curr_node)
+        for neighbor in graph[curr_node]:
+            distance = distances[curr_node] + graph.edge_weights[(curr_node, neighbor)]
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                prev[neighbor] = curr_node
+                heuristic = landmarks.lower_bound(neighbor, v)
+                if heuristic < float('inf'):
+                    heapq.heappush(queue, (distance + heuristic, next(tie_breaker), neighbor))
+
+    distance_dict = {(u, v): distances[v]} if v in prev else {}
+    prev_dict = {(u, node): prev_node for node, prev_node in prev.items()}
+    return {(u, v): _shortest_path(distance_dict, prev_dict, u, v)}
@@ -0,0 +1,161 @@
+
+import sys
+import tracemalloc
+from typing import Callable, Dict, Optional, Tuple
+
+from algorithms.floyd_warshall import floyd_warshall
+import datasets as ds
+from graph_cls import GraphTypeHint
+
+
+DATASETS = {
+    'path_graph': ds.path_graph,
+    'weighted_path_graph': ds.weighted_path_graph,
+    'connected_component_graph': ds.connected_component_graph,
+    'random_graph_1k': lambda: ds.random_graph(1_000, 5_000, max_weight=10, seed=0)
+}
+
+
+def _deep_size(obj, seen: set) -> int:
+    """
+    Helper function to get the size in bytes of an object and the objects it holds, counting shared objects once.
+
+    :param obj: any object
+
+    :param seen: set of ids of objects already counted
+
+    :return: int; size in bytes
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item, seen) for item in obj)
+    return size
+
+
+def graph_footprint(graph: GraphTypeHint) -> Dict[str, int]:
+    """
+    Break down the memory used by a graph.  Node objects are counted once, under 'nodes', even though they are
+    referenced from the adjacency, the edge tuples and the id table.  The id adjacency is only counted once it has
+    been built, e.g. by djikstra or bfs.
+
+    :param graph: Graph or DiGraph object
+
+    :return: dict of sizes in bytes for 'nodes' (node objects), 'adjacency' (the g dict, its neighbor sets and the
+    predecessor sets of a directed graph), 'edge_weights' (the edge_weights dict table), 'edge_tuples' (the (u, v)
+    keys), 'weights' (the weight objects), 'node_ids' (the node id tables), 'id_adjacency' (the cached adjacency by
+    node id), 'weight_counts' (the weight counter and the min / max weight heaps) and 'total'
+    """
+    seen = set()
+    footprint = {'nodes': sum(_deep_size(node, seen) for node in graph.g)}
+    footprint['adjacency'] = sys.getsizeof(graph.g) + sum(_deep_size(s, seen) for s in graph.g.values())
+    if graph._predecessors is not None:
+        footprint['adjacency'] += _deep_size(graph._predecessors, seen)
+    seen.add(id(graph.g))
+    footprint['edge_weights'] = sys.getsizeof(graph.edge_weights)
+    seen.add(id(graph.edge_weights))
+    footprint['edge_tuples'] = sum(_deep_size(edge, seen) for edge in graph.edge_weights)
+    footprint['weights'] = sum(_deep_size(weight, seen) for weight in graph.edge_weights.values())
+    footprint['node_ids'] = _deep_size(graph._node_ids, seen) + _deep_size(graph._id_nodes, seen)
+    footprint['id_adjacency'] = _deep_size(graph._id_adjacency, seen) if graph._id_adjacency is not None else 0
+    footprint['weight_counts'] = sum(
+        _deep_size(part, seen) for part in (graph._weight_counts, graph._min_weights, graph._max_weights)
+    )
+    footprint['total'] = sum(footprint.values())
+    return footprint
+
+
+def peak_memory(func: Callable, *args, **kwargs) -> Tuple[object, int]:
+    """
+    Call the function and measure the peak memory it allocates with tracemalloc.  If tracemalloc is already tracing,
+    its peak is left as is, so the result is an upper bound that also covers the caller's earlier allocations.
+
+    :param func: function to call, e.g. floyd_warshall
+
+    :param args: positional arguments passed to func
+
+    :param kwargs: keyword arguments passed to func
+
+    :return: 2-element tuple of the function's return value and the peak allocation in bytes
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    baseline, _peak = tracemalloc.get_traced_memory()
+    try:
+        result = func(*args, **kwargs)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, peak - baseline
+
+
+def _floyd_warshall_bytes_per_pair(n_nodes: int = 80) -> float:
+    """
+    Helper function to measure the peak memory of floyd_warshall per (source, target) pair on a small random graph.
+    Its working dicts fill in every pair, so the peak grows with the number of pairs regardless of the edges.
+
+    :param n_nodes: int; order of the sample graph.  Default is 80.
+
+    :return: float; bytes per pair
+    """
+    graph = ds.random_graph(n_nodes, 2 * n_nodes, max_weight=10, seed=0)
+    _result, peak = peak_memory(floyd_warshall, graph)
+    return peak / n_nodes ** 2
+
+
+def extrapolate(graph: GraphTypeHint, n_nodes: int, n_edges: int) -> Dict[str, int]:
+    """
+    Estimate the memory needed for a graph of n_nodes and n_edges by scaling the per-node and per-edge costs of the
+    sample graph, and for a floyd_warshall run on it.  The sample's id adjacency is counted, since almost every algorithm
+    fills it in, and dropped again afterwards if it was not already built.
+
+    :param graph: Graph or DiGraph object with at least one edge, used as a sample
+
+    :param n_nodes: int; target number of nodes
+
+    :param n_edges: int; target number of edges, counted like graph.size
+
+    :return: dict of estimated sizes in bytes for 'graph' and 'floyd_warshall'
+    """
+    if not graph.size:
+        raise ValueError('graph must contain edges to extrapolate from')
+    had_id_adjacency = graph._id_adjacency is not None
+    graph.id_adjacency()
+    try:
+        footprint = graph_footprint(graph)
+    finally:
+        if not had_id_adjacency:
+            graph._id_adjacency = None
+    n_sets = 2 if graph.is_directed else 1
+    per_node = (footprint['nodes'] + footprint['node_ids'] + n_sets * sys.getsizeof(set())) / graph.order
+    per_edge = (footprint['total'] - per_node * graph.order) / graph.size
+    return {
+        'graph': int(per_node * n_nodes + per_edge * n_edges),
+        'floyd_warshall': int(_floyd_warshall_bytes_per_pair() * n_nodes ** 2)
+    }
+
+
+def profile_datasets(func: Callable, graphs: Optional[Dict[str, Callable]] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Measure the graph footprint and the peak memory of an algorithm on each dataset.
+
+    :param func: function taking a graph, e.g. floyd_warshall
+
+    :param graphs: optional; dict keyed by dataset name and a function returning the graph.  Default is None, which
+    uses DATASETS.
+
+    :return: dict keyed by dataset name and a dict of its 'graph' total footprint and 'peak' allocation in bytes
+    """
+    graphs = DATASETS if graphs is None else graphs
+    report = {}
+    for name, make_graph in graphs.items():
+        graph = make_graph()
+        _result, peak = peak_memory(func, graph)
+        report[name] = {'graph': graph_footprint(graph)['total'], 'peak': peak}
+    return report
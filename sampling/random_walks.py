@@ -0,0 +1,224 @@
+
+from array import array
+import random
+from typing import Generator, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from exceptions import NodeNotInGraphException
+from graph_cls import GraphTypeHint
+from parallel.csr import to_csr
+
+
+def _alias_table(weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """
+    Helper function to build an alias table with Vose's method, for drawing index i with probability proportional to
+    weights[i] in constant time.  If every weight is zero, the indices are drawn uniformly.
+
+    :param weights: sequence of non-negative floats
+
+    :return: 2-element tuple of lists.  1st element is the probability of keeping each index.  2nd element is the
+    index drawn instead when it is not kept.
+    """
+    n = len(weights)
+    total = sum(weights)
+    scaled = [weight * n / total for weight in weights] if total > 0 else [1.0] * n
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, value in enumerate(scaled) if value < 1]
+    large = [i for i, value in enumerate(scaled) if value >= 1]
+    while small and large:
+        i, j = small.pop(), large.pop()
+        prob[i] = scaled[i]
+        alias[i] = j
+        scaled[j] -= 1 - scaled[i]
+        if scaled[j] < 1:
+            small.append(j)
+        else:
+            large.append(j)
+    return prob, alias
+
+
+class RandomWalker:
+    """
+    Class RandomWalker for generating random walks over a compressed sparse row snapshot of a graph.  Weighted
+    transitions are drawn from per-node alias tables; node2vec's second-order bias is applied by rejection sampling,
+    so no per-edge tables are built.
+    """
+    def __init__(self, graph: GraphTypeHint):
+        """
+        Instantiate an object of class RandomWalker.  Later changes to the graph are not reflected in the walks.
+
+        :param graph: Graph or DiGraph object.  Edge weights must be non-negative; transitions are proportional to
+        them if the graph is weighted, else uniform.
+        """
+        if graph.has_negative_weights:
+            raise ValueError('graph must not contain negative edge weights')
+        self.csr = to_csr(graph)
+        self.is_weighted = graph.is_weighted
+        self.alias_prob = array('d')
+        self.alias_index = array('q')
+        self._neighbor_sets = None
+        if self.is_weighted:
+            offsets = self.csr.offsets
+            for i in range(len(self.csr)):
+                prob, alias = _alias_table(self.csr.weights[offsets[i]:offsets[i + 1]])
+                self.alias_prob.extend(prob)
+                self.alias_index.extend(alias)
+
+    def _step(self, node: int, rng: random.Random) -> int:
+        """
+        Helper function to draw the next node of a first-order walk.
+
+        :param node: int; index of the current node, which must have neighbors
+
+        :param rng: random.Random
+
+        :return: int; index of the next node
+        """
+        start = self.csr.offsets[node]
+        k = start + int(rng.random() * (self.csr.offsets[node + 1] - start))
+        if self.is_weighted and (rng.random() >= self.alias_prob[k]):
+            k = start + self.alias_index[k]
+        return self.csr.targets[k]
+
+    def _biased_step(self, prev_node: int, node: int, p: float, q: float, rng: random.Random) -> int:
+        """
+        Helper function to draw the next node of a node2vec walk.  A candidate from the first-order distribution is
+        accepted with probability proportional to 1 / p if it returns to the previous node, 1 if it is a neighbor of
+        the previous node, and 1 / q otherwise.
+
+        :param prev_node: int; index of the previous node
+
+        :param node: int; index of the current node, which must have neighbors
+
+        :param p: float; return parameter
+
+        :param q: float; in-out parameter
+
+        :param rng: random.Random
+
+        :return: int; index of the next node
+        """
+        prev_neighbors = self._neighbor_sets[prev_node]
+        max_bias = max(1 / p, 1, 1 / q)
+        while True:
+            candidate = self._step(node, rng)
+            if candidate == prev_node:
+                bias = 1 / p
+            elif candidate in prev_neighbors:
+                bias = 1
+            else:
+                bias = 1 / q
+            if rng.random() * max_bias < bias:
+                return candidate
+
+    def _walk_chunk(self, starts: List[int], walk_length: int, p: float, q: float, rng: random.Random) -> List[List]:
+        """
+        Helper function to advance one walker per start node in lock step.  A walker stops early at a node with no
+        neighbors.
+
+        :param starts: list of start node indices
+
+        :param walk_length: int; maximum number of nodes per walk
+
+        :param p: float; return parameter
+
+        :param q: float; in-out parameter
+
+        :param rng: random.Random
+
+        :return: list of walks, each a list of node labels
+        """
+        offsets = self.csr.offsets
+        biased = (p != 1) or (q != 1)
+        walks = [[start] for start in starts]
+        active = walks
+        for _ in range(walk_length - 1):
+            still_active = []
+            for walk in active:
+                node = walk[-1]
+                if offsets[node] == offsets[node + 1]:
+                    continue
+                if biased and (len(walk) > 1):
+                    walk.append(self._biased_step(walk[-2], node, p, q, rng))
+                else:
+                    walk.append(self._step(node, rng))
+                still_active.append(walk)
+            active = still_active
+            if not active:
+                break
+        nodes = self.csr.nodes
+        return [[nodes[i] for i in walk] for walk in walks]
+
+    def walks(
+            self, walk_length: int, walks_per_node: int = 1, start_nodes: Optional[Iterable[Hashable]] = None,
+            p: float = 1, q: float = 1, seed: Optional[int] = None, chunk_size: int = 10_000
+    ) -> Generator[List[List], None, None]:
+        """
+        Generate random walks in chunks.  Each round starts one walk from every start node in a shuffled order.
+
+        :param walk_length: int; maximum number of nodes per walk, including the start node
+
+        :param walks_per_node: int; number of walks started from each start node.  Default is 1.
+
+        :param start_nodes: optional; iterable of nodes to start walks from.  Default is None, which uses every node.
+
+        :param p: float; node2vec return parameter.  Default is 1.
+
+        :param q: float; node2vec in-out parameter.  Default is 1.  With p = q = 1 the walks are first-order.
+
+        :param seed: optional; int seed, so the same arguments generate the same walks.  Default is None.
+
+        :param chunk_size: int; number of walks per chunk.  Default is 10,000.
+
+        :return: generator of lists of walks, each a list of node labels
+        """
+        if (p <= 0) or (q <= 0):
+            raise ValueError('p and q must be positive')
+        if walk_length < 1:
+            raise ValueError('walk_length must be at least 1')
+        if ((p != 1) or (q != 1)) and (self._neighbor_sets is None):
+            offsets, targets = self.csr.offsets, self.csr.targets
+            self._neighbor_sets = [
+                frozenset(targets[offsets[i]:offsets[i + 1]]) for i in range(len(self.csr))
+            ]
+
+        rng = random.Random(seed)
+        index = self.csr.index
+        if start_nodes is None:
+            starts = list(range(len(self.csr)))
+        else:
+            starts = []
+            for node in start_nodes:
+                if node not in index:
+                    raise NodeNotInGraphException(node)
+                starts.append(index[node])
+        for _ in range(walks_per_node):
+            rng.shuffle(starts)
+            for i in range(0, len(starts), chunk_size):
+                yield self._walk_chunk(starts[i:i + chunk_size], walk_length, p, q, rng)
+
+
+def random_walks(
+        graph: GraphTypeHint, walk_length: int, walks_per_node: int = 1, p: float = 1, q: float = 1,
+        seed: Optional[int] = None
+) -> List[List]:
+    """
+    Generate random walks from every node of the graph.  Use RandomWalker to reuse the alias tables across calls or
+    to stream the walks in chunks.
+
+    :param graph: Graph or DiGraph object
+
+    :param walk_length: int; maximum number of nodes per walk, including the start node
+
+    :param walks_per_node: int; number of walks started from each node.  Default is 1.
+
+    :param p: float; node2vec return parameter.  Default is 1.
+
+    :param q: float; node2vec in-out parameter.  Default is 1.
+
+    :param seed: optional; int seed.  Default is None.
+
+    :return: list of walks, each a list of node labels
+    """
+    walker = RandomWalker(graph)
+    return [walk for chunk in walker.walks(walk_length, walks_per_node, p=p, q=q, seed=seed) for walk in chunk]
@@ -1,10 +1,17 @@
 
 import pytest
 
+from algorithms.dag import critical_path, dag_longest_path, dag_shortest_path
+from algorithms.delta_stepping import delta_stepping
 from algorithms.djikstra import djikstra
+from algorithms.dynamic_apsp import DynamicAllPairsShortestPath
 from algorithms.floyd_warshall import floyd_warshall
 from algorithms.kosaraju import kosaraju
+import algorithms.minimum_spanning_tree as mst
 from algorithms.bellman_ford import bellman_ford
+from algorithms.search import bfs, bfs_levels, dfs
+from algorithms.topological_sort import is_acyclic, topological_sort
+from exceptions import CycleDetectedException
 import graph_cls as gc
 import datasets as ds
 import paths.shortest_path as sp
@@ -45,3 +52,160 @@ def test_bellman_ford():
 def test_kosaraju(graph, expected):
     scc = {tuple(sorted(x)) for x in kosaraju(graph)}
     assert not scc.symmetric_difference(expected)
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_dynamic_all_pairs_shortest_path(is_directed):
+    graph = ds.random_graph(25, 50, is_directed=is_directed, max_weight=10, seed=0)
+    apsp = DynamicAllPairsShortestPath(graph)
+
+    def assert_matches_floyd_warshall():
+        distance_dict, _prev_dict = floyd_warshall(graph)
+        assert apsp.distance_dict == distance_dict
+        for u, v in distance_dict:
+            path, distance = sp._shortest_path(apsp.distance_dict, apsp.prev_dict, u, v)
+            assert sum(graph.get_edge_weight(*edge) for edge in zip(path, path[1:])) == (distance if path else 0)
+
+    graph.add_edge(0, 30, 2)
+    assert_matches_floyd_warshall()
+    for u, v in list(graph.edges)[:10]:
+        if (u, v) in graph.edge_weights:
+            graph.add_edge(u, v, graph.get_edge_weight(u, v) // 2)
+    assert_matches_floyd_warshall()
+    for u, v in list(graph.edges)[10:20]:
+        if (u, v) in graph.edge_weights:
+            graph.add_edge(u, v, graph.get_edge_weight(u, v) + 5)
+    assert_matches_floyd_warshall()
+    for u, v in list(graph.edges)[20:30]:
+        if (u, v) in graph.edge_weights:
+            graph.remove_edge(u, v)
+    assert_matches_floyd_warshall()
+    graph.remove_node(30)
+    assert_matches_floyd_warshall()
+
+
+def test_dynamic_all_pairs_shortest_path_negative_cycle():
+    graph = gc.DiGraph(edges=[('a', 'b', 2), ('b', 'c', 3)])
+    apsp = DynamicAllPairsShortestPath(graph)
+    later_apsp = DynamicAllPairsShortestPath(graph)
+    with pytest.raises(ValueError):
+        graph.add_edge('c', 'a', -6)
+    assert ('c', 'a') not in graph.edge_weights
+    assert apsp.distance_dict == later_apsp.distance_dict == floyd_warshall(graph)[0]
+
+    graph.add_edge('c', 'a', -4)
+    assert apsp.distance_dict == later_apsp.distance_dict == floyd_warshall(graph)[0]
+
+
+def test_topological_sort():
+    graph = ds.weighted_path_graph(True)
+    order = topological_sort(graph)
+    assert set(order) == graph.nodes
+    position = {node: i for i, node in enumerate(order)}
+    assert all(position[u] < position[v] for u, v in graph.edges)
+    assert is_acyclic(graph)
+
+
+def test_topological_sort_cycle():
+    graph = ds.connected_component_graph()
+    assert not is_acyclic(graph)
+    with pytest.raises(CycleDetectedException) as exc_info:
+        topological_sort(graph)
+    cycle = exc_info.value.cycle
+    assert all((u, v) in graph.edges for u, v in zip(cycle, cycle[1:] + cycle[:1]))
+
+
+def test_topological_sort_cache():
+    graph = ds.weighted_path_graph(True)
+    order = topological_sort(graph)
+    order.reverse()
+    assert topological_sort(graph) != order
+    u, v = next(iter(graph.edges))
+    graph.add_edge(v, u, 1)
+    assert not is_acyclic(graph)
+    graph.remove_edge(v, u)
+    assert is_acyclic(graph)
+    graph.add_node('z')
+    assert 'z' in topological_sort(graph)
+    graph.remove_node('z')
+    assert 'z' not in topological_sort(graph)
+
+
+def test_dag_paths():
+    graph = ds.weighted_path_graph(True)
+    graph.add_edge('c', 'e', -20)
+    shortest_path, distance = sp._shortest_path(*dag_shortest_path(graph, 'a'), 'a', 'f')
+    assert (shortest_path, distance) == (list('abcef'), -8)
+    assert shortest_path == sp.shortest_path(graph, 'a', 'f')[('a', 'f')][0]
+    longest_path, distance = sp._shortest_path(*dag_longest_path(graph, 'a'), 'a', 'd')
+    assert (longest_path, distance) == (list('ad'), 100)
+    assert critical_path(graph) == (list('ad'), 100)
+
+
+@pytest.mark.parametrize('algorithm', ['kruskal', 'prim', 'boruvka'])
+def test_minimum_spanning_tree(algorithm):
+    graph = ds.weighted_path_graph(False)
+    tree, total_weight = mst.minimum_spanning_tree(graph, algorithm)
+    assert total_weight == 15
+    assert tree.nodes == graph.nodes
+    assert tree.size == graph.order - 2
+    assert tree.edges <= graph.edges
+
+    edges, total_weight = mst.minimum_spanning_tree(graph, algorithm, as_graph=False)
+    assert sum(weight for _u, _v, weight in edges) == total_weight == 15
+
+
+def test_minimum_spanning_tree_algorithms_agree():
+    graph = ds.random_graph(200, 600, max_weight=50, seed=0)
+    expected = sum(weight for _u, _v, weight in mst.kruskal(graph))
+    assert sum(weight for _u, _v, weight in mst.prim(graph)) == expected
+    assert sum(weight for _u, _v, weight in mst.boruvka(graph, processes=2, chunk_size=100)) == expected
+    benchmark = mst.benchmark_minimum_spanning_tree(graph)
+    assert {result['total_weight'] for result in benchmark.values()} == {expected}
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+@pytest.mark.parametrize('delta,processes', [(None, None), (3, None), (0.5, None), (None, 2)])
+def test_delta_stepping(delta, processes, use_numpy):
+    if use_numpy:
+        pytest.importorskip('numpy')
+    graph = ds.random_graph(80, 240, is_directed=True, max_weight=10, seed=0)
+    for u in [0, 1, 2]:
+        distance_dict, prev_dict = delta_stepping(graph, u, delta, processes, parallel_threshold=1, use_numpy=use_numpy)
+        expected_distance_dict, _expected_prev_dict = djikstra(graph, u)
+        assert distance_dict == expected_distance_dict
+        assert set(prev_dict) == set(expected_distance_dict)
+        for (source, v), prev in prev_dict.items():
+            assert distance_dict.get((source, prev), 0) + graph.get_edge_weight(prev, v) == distance_dict[(source, v)]
+
+
+@pytest.mark.parametrize('delta', [0, -1])
+def test_delta_stepping_invalid_delta(delta):
+    graph = ds.random_graph(10, 20, is_directed=True, max_weight=10, seed=0)
+    with pytest.raises(ValueError):
+        delta_stepping(graph, 0, delta)
+
+
+@pytest.mark.parametrize('alpha, beta', [(14, 24), (float('inf'), float('inf')), (0, 0)])
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_bfs_levels(alpha, beta, is_directed):
+    graph = ds.random_graph(200, 600, is_directed=is_directed, seed=3)
+    depths, parents = bfs_levels(graph, 0, alpha, beta)
+    distance_dict, _prev_dict = djikstra(gc.DiGraph.from_iterable(
+        ((u, v, 1) for u, v in graph.edge_weights), nodes=graph.g
+    ), 0)
+    assert depths == {0: 0, **{node: distance for (_u, node), distance in distance_dict.items()}}
+    assert set(parents) == set(depths) - {0}
+    for node, parent in parents.items():
+        assert node in graph.g[parent]
+        assert depths[parent] + 1 == depths[node]
+
+
+def test_bfs_dfs_wrappers():
+    graph = ds.random_graph(100, 150, is_directed=True, seed=4)
+    depths, _parents = bfs_levels(graph, 0)
+    bfs_order = list(bfs(graph, 0))
+    assert set(bfs_order) == set(depths) - {0}
+    assert [depths[node] for node in bfs_order] == sorted(depths[node] for node in bfs_order)
+    dfs_order = list(dfs(graph, 0))
+    assert sorted(dfs_order) == sorted(bfs_order)
@@ -0,0 +1,58 @@
+
+import sys
+
+import pytest
+
+import datasets as ds
+import graph_cls as gc
+from clustering import clustering as cl
+
+
+def _brute_force_triangles(graph):
+    counts = dict.fromkeys(graph.nodes, 0)
+    for u in graph.nodes:
+        neighbors = graph[u] - {u}
+        for v in neighbors:
+            for w in neighbors:
+                if (v != w) and (w in graph[v]):
+                    counts[u] += 1
+    return {node: count // 2 for node, count in counts.items()}
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_triangles(use_numpy):
+    if use_numpy:
+        pytest.importorskip('numpy')
+    graph = ds.random_graph(60, 300, seed=0)
+    graph.add_edge(0, 0)
+    assert cl.triangles(graph, use_numpy) == _brute_force_triangles(graph)
+
+
+@pytest.mark.parametrize('max_bitmap_bytes', [cl._MAX_BITMAP_BYTES, 0])
+def test_triangles_numpy_chunks(monkeypatch, max_bitmap_bytes):
+    pytest.importorskip('numpy')
+    monkeypatch.setattr(cl, '_MAX_BITMAP_BYTES', max_bitmap_bytes)
+    monkeypatch.setattr(cl, '_WEDGE_CHUNK_SIZE', 7)
+    graph = ds.random_graph(60, 300, seed=1)
+    assert cl.triangles(graph, use_numpy=True) == cl.triangles(graph)
+
+
+def test_triangles_numpy_missing(monkeypatch):
+    # A None entry in sys.modules makes the import fail whether or not NumPy is installed
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    with pytest.raises(ImportError):
+        cl.triangles(ds.random_graph(10, 20, seed=0), use_numpy=True)
+
+
+def test_clustering():
+    # Triangle a-b-c with a pendant node d attached to c
+    graph = gc.Graph(edges=[('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd')])
+    assert cl.triangles(graph) == {'a': 1, 'b': 1, 'c': 1, 'd': 0}
+    assert cl.local_clustering(graph) == pytest.approx({'a': 1, 'b': 1, 'c': 1 / 3, 'd': 0})
+    assert cl.average_clustering(graph) == pytest.approx((1 + 1 + 1 / 3) / 4)
+    assert cl.transitivity(graph) == pytest.approx(3 / 5)
+
+
+def test_clustering_directed():
+    with pytest.raises(TypeError):
+        cl.triangles(ds.path_graph(True))
@@ -1,7 +1,9 @@
 
 import pytest
 
+from algorithms.search import bfs
 import connectivity.connectivity as conn
+from connectivity.reachability import ReachabilityIndex
 import datasets as ds
 import graph_cls as gc
 
@@ -15,3 +17,58 @@ import graph_cls as gc
 )
 def test_connectivity(graph, expected):
     assert conn.is_connected(graph) == expected
+
+
+@pytest.mark.parametrize(
+    'graph',
+    [
+        ds.connected_component_graph(),
+        ds.path_graph(False),
+        ds.random_graph(80, 120, is_directed=True, seed=0),
+        ds.random_graph(80, 200, is_directed=True, seed=1)
+    ]
+)
+def test_reachability_index(graph):
+    index = ReachabilityIndex(graph, seed=0)
+    for u in graph.nodes:
+        reachable_nodes = set(bfs(graph, u)) | {u}
+        for v in graph.nodes:
+            assert index.reachable(u, v) == (v in reachable_nodes)
+    assert index.stats['size'] > 0
+
+
+def test_reachability_index_search(monkeypatch):
+    graph = ds.random_graph(150, 300, is_directed=True, seed=2)
+    index = ReachabilityIndex(graph, n_traversals=1, seed=0)
+    n_searches = 0
+    search = index._search
+
+    def counting_search(c, d):
+        nonlocal n_searches
+        n_searches += 1
+        return search(c, d)
+
+    monkeypatch.setattr(index, '_search', counting_search)
+    for u in graph.nodes:
+        reachable_nodes = set(bfs(graph, u)) | {u}
+        for v in graph.nodes:
+            assert index.reachable(u, v) == (v in reachable_nodes)
+    assert n_searches > 0
+
+
+def test_reachability_index_updates():
+    graph = ds.connected_component_graph()
+    index = ReachabilityIndex(graph, seed=0)
+    assert not index.reachable('a', 'f')
+
+    graph.add_edge('b', 'a')
+    assert not index.is_stale
+    graph.add_edge('e', 'f')
+    assert index.is_stale
+    assert index.reachable('a', 'f')
+
+    graph.remove_edge('e', 'f')
+    assert not index.reachable('a', 'f')
+    graph.add_edge('a', 'x')
+    assert index.reachable('a', 'x')
+    assert not index.reachable('x', 'a')
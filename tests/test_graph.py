@@ -1,8 +1,13 @@
 
+from array import array
+import copy
+import pickle
+import random
 
 import pytest
 
 import datasets as ds
+import graph_cls as gc
 
 
 @pytest.mark.parametrize('is_directed', [False, True])
@@ -151,3 +156,126 @@ def test_remove_node():
         assert (neighbor, 'c') not in edges_after_removal
     assert not graph.path_exists('b', 'd')
     assert not graph.path_exists('d', 'b')
+
+
+def test_remove_node_directed():
+    graph = ds.path_graph(True)
+    graph.remove_node('c')
+    assert 'c' not in graph.nodes
+    assert not [edge for edge in graph.edges if 'c' in edge]
+    assert 'c' not in graph.get_neighbors('b')
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_weight_properties(is_directed):
+    graph = ds.path_graph(is_directed)
+    assert not graph.is_weighted
+    assert (graph.min_weight, graph.max_weight) == (1, 1)
+
+    graph.add_edge('a', 'b', -3)
+    graph.add_edge('c', 'd', 7)
+    assert graph.is_weighted
+    assert graph.has_negative_weights
+    assert graph.n_negative_edges == (1 if is_directed else 2)
+    assert (graph.min_weight, graph.max_weight) == (-3, 7)
+
+    graph.add_edge('a', 'b', 1)
+    assert not graph.has_negative_weights
+    assert (graph.min_weight, graph.max_weight) == (1, 7)
+
+    graph.remove_edge('c', 'd')
+    assert not graph.is_weighted
+    assert (graph.min_weight, graph.max_weight) == (1, 1)
+
+    graph.remove_nodes_from(graph.nodes)
+    assert not graph.is_weighted
+    assert graph.min_weight is None
+
+
+def test_weight_bounds_churn():
+    rng = random.Random(0)
+    graph = gc.DiGraph()
+    for _ in range(2000):
+        u, v = rng.randrange(30), rng.randrange(30)
+        if graph.edge_weights and rng.random() < 0.4:
+            graph.remove_edge(*rng.choice(list(graph.edge_weights)))
+        else:
+            graph.add_edge(u, v, rng.choice([rng.random(), rng.randrange(-5, 5)]))
+        weights = graph.edge_weights.values()
+        assert graph.min_weight == (min(weights) if weights else None)
+        assert graph.max_weight == (max(weights) if weights else None)
+
+
+@pytest.mark.parametrize('graph_type', [gc.Graph, gc.DiGraph])
+def test_from_edge_arrays(graph_type):
+    src = array('q', [0, 1, 2, 2])
+    dst = array('q', [1, 2, 0, 3])
+    weights = (w for w in [1.5, -2, 3, 1])
+    graph = graph_type.from_edge_arrays(src, dst, weights, nodes=[4])
+    expected = graph_type(nodes=[4], edges=[(0, 1, 1.5), (1, 2, -2), (2, 0, 3), (2, 3, 1)])
+    assert graph.g == expected.g
+    assert graph.edge_weights == expected.edge_weights
+    assert graph.n_negative_edges == expected.n_negative_edges
+    assert (graph.min_weight, graph.max_weight) == (-2, 3)
+
+
+@pytest.mark.parametrize('graph_type', [gc.Graph, gc.DiGraph])
+def test_from_edge_arrays_length_mismatch(graph_type):
+    with pytest.raises(ValueError):
+        graph_type.from_edge_arrays([0, 1, 2], [1, 2])
+    with pytest.raises(ValueError):
+        graph_type.from_edge_arrays([0, 1], [1, 2], weights=(w for w in [1, 2, 3]))
+
+
+@pytest.mark.parametrize('graph_type', [gc.Graph, gc.DiGraph])
+def test_from_iterable_deduplicate(graph_type):
+    edges = [('a', 'b', 1), ('b', 'c'), ('a', 'b', 5)]
+    graph = graph_type.from_iterable(iter(edges))
+    assert graph.get_edge_weight('a', 'b') == 5
+    assert graph.size == 2
+    with pytest.raises(ValueError):
+        graph_type.from_iterable(iter(edges), deduplicate=False)
+    assert graph_type.from_iterable([('a', 'b'), ('b', 'c')], deduplicate=False).size == 2
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_node_ids(is_directed):
+    graph = ds.path_graph(is_directed)
+    ids = {node: graph.node_id(node) for node in graph.nodes}
+    assert sorted(ids.values()) == list(range(graph.order))
+    assert all(graph.node_label(node_id) == node for node, node_id in ids.items())
+
+    graph.remove_node('c')
+    for copied_graph in (graph, copy.deepcopy(graph), pickle.loads(pickle.dumps(graph))):
+        with pytest.raises(KeyError):
+            copied_graph.node_label(ids['c'])
+    graph.add_edge('x', 'a', 4)
+    assert graph.node_id('x') == ids['c']
+    assert graph.id_capacity == len(ids)
+
+    adjacency = graph.id_adjacency()
+    edges = {
+        (graph.node_label(u), graph.node_label(v)): weight
+        for u, neighbors in enumerate(adjacency) for v, weight in neighbors
+    }
+    assert edges == graph.edge_weights
+
+
+@pytest.mark.parametrize('is_directed, max_edges', [(False, 6), (True, 12)])
+def test_random_graph_max_edges(is_directed, max_edges):
+    assert ds.random_graph(4, max_edges, is_directed, seed=0).size == max_edges
+    with pytest.raises(ValueError):
+        ds.random_graph(4, max_edges + 1, is_directed)
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_remove_nodes_incoming_edges(is_directed):
+    graph = ds.random_graph(100, 400, is_directed=is_directed, seed=0)
+    graph.add_edge(3, 3)
+    removed = set(range(0, 100, 2))
+    graph.remove_nodes_from(removed)
+    assert not [edge for edge in graph.edges if removed.intersection(edge)]
+    assert all(not (neighbors & removed) for neighbors in graph.g.values())
+    if is_directed:
+        predecessors = {node: {u for u, v in graph.edges if v == node} for node in graph.g}
+        assert graph._predecessors == predecessors
@@ -0,0 +1,41 @@
+
+import pytest
+
+from algorithms.djikstra import djikstra
+import datasets as ds
+from parallel.csr import to_csr
+from parallel.shared_csr import SharedCSR, csr_bfs, csr_djikstra, run_per_source
+
+
+def test_to_csr():
+    graph = ds.weighted_path_graph(True)
+    csr = to_csr(graph)
+    assert len(csr) == graph.order
+    edges = {
+        (csr.nodes[i], csr.nodes[j]): weight for i in range(len(csr)) for j, weight in csr.neighbors(i)
+    }
+    assert edges == graph.edge_weights
+
+
+def test_shared_csr_attach():
+    graph = ds.weighted_path_graph(False)
+    with SharedCSR.from_graph(graph) as csr:
+        attached = SharedCSR.attach(csr.handle)
+        assert attached.nodes == csr.nodes
+        assert list(attached.offsets) == list(csr.offsets)
+        assert list(attached.targets) == list(csr.targets)
+        assert list(attached.weights) == list(csr.weights)
+        attached.close()
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_run_per_source(is_directed):
+    graph = ds.random_graph(30, 70, is_directed=is_directed, max_weight=10, seed=0)
+    distance_dict, prev_dict = run_per_source(graph, csr_djikstra, processes=2)
+    for u in graph.nodes:
+        expected_distance_dict, _expected_prev_dict = djikstra(graph, u)
+        assert {k: v for k, v in distance_dict.items() if k[0] == u} == expected_distance_dict
+
+    distance_dict, _prev_dict = run_per_source(graph, csr_bfs, sources=[0, 1], processes=2)
+    assert {source for source, _target in distance_dict} <= {0, 1}
+    assert all(distance == int(distance) for distance in distance_dict.values())
@@ -0,0 +1,202 @@
+
+import pytest
+
+import datasets as ds
+import graph_cls as gc
+from paths.all_pairs import all_pairs_rows, read_binary, write_binary, write_csv
+import paths.shortest_path as sp
+from paths.contraction_hierarchies import ContractionHierarchy
+import paths.distance_measures as dm
+from paths.k_shortest_paths import k_shortest_paths
+from paths.landmarks import LandmarkIndex
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+@pytest.mark.parametrize('method', ['farthest', 'degree'])
+def test_alt_shortest_path(is_directed, method):
+    graph = ds.weighted_path_graph(is_directed)
+    landmarks = LandmarkIndex.build(graph, k=3, method=method)
+    for u in graph.nodes:
+        for v in graph.nodes:
+            _expected_path, expected_distance = sp._shortest_path(*sp.djikstra(graph, u), u, v)
+            path, distance = sp.alt_shortest_path(graph, u, v, landmarks)[(u, v)]
+            assert distance == expected_distance
+            assert sum(graph.get_edge_weight(*edge) for edge in zip(path, path[1:])) == (distance if path else 0)
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_landmark_bounds(is_directed):
+    graph = ds.weighted_path_graph(is_directed)
+    landmarks = LandmarkIndex.build(graph, k=2)
+    distance_dict, _prev_dict = sp.floyd_warshall(graph)
+    for u in graph.nodes:
+        for v in graph.nodes:
+            lower_bound, upper_bound = landmarks.estimate(u, v)
+            distance = distance_dict.get((u, v), float('inf'))
+            assert lower_bound <= distance <= upper_bound
+
+
+def test_landmark_index_save_load(tmp_path):
+    graph = ds.weighted_path_graph(True)
+    landmarks = LandmarkIndex.build(graph, k=3)
+    path = str(tmp_path / 'landmarks.pkl')
+    landmarks.save(path)
+    loaded = LandmarkIndex.load(path)
+    assert loaded.landmarks == landmarks.landmarks
+    assert loaded.forward == landmarks.forward
+    assert loaded.backward == landmarks.backward
+
+
+@pytest.mark.parametrize(
+    'graph',
+    [
+        ds.weighted_path_graph(False),
+        ds.weighted_path_graph(True),
+        ds.random_graph(60, 150, is_directed=True, max_weight=10, seed=0),
+        ds.random_graph(60, 120, is_directed=False, max_weight=10, seed=1)
+    ]
+)
+def test_contraction_hierarchy(graph):
+    hierarchy = ContractionHierarchy.build(graph)
+    for u in graph.nodes:
+        distance_dict, prev_dict = sp.djikstra(graph, u)
+        for v in graph.nodes:
+            _expected_path, expected_distance = sp._shortest_path(distance_dict, prev_dict, u, v)
+            path, distance = hierarchy.shortest_path(u, v)[(u, v)]
+            assert distance == expected_distance
+            assert sum(graph.get_edge_weight(*edge) for edge in zip(path, path[1:])) == (distance if path else 0)
+
+
+def _all_simple_path_distances(graph, u, v):
+    distances = []
+    stack = [[u]]
+    while stack:
+        path = stack.pop()
+        if path[-1] == v:
+            distances.append(sum(graph.get_edge_weight(*edge) for edge in zip(path, path[1:])))
+            continue
+        stack.extend(path + [neighbor] for neighbor in graph[path[-1]] if neighbor not in path)
+    return sorted(distances)
+
+
+@pytest.mark.parametrize(
+    'graph',
+    [ds.weighted_path_graph(False), ds.random_graph(9, 20, is_directed=True, max_weight=5, seed=0)]
+)
+def test_k_shortest_paths(graph):
+    nodes = sorted(graph.nodes, key=str)
+    for u in nodes:
+        for v in nodes:
+            if u == v:
+                continue
+            paths = list(k_shortest_paths(graph, u, v))
+            assert [distance for _path, distance in paths] == _all_simple_path_distances(graph, u, v)
+            assert len({tuple(path) for path, _distance in paths}) == len(paths)
+            for path, distance in paths:
+                assert (path[0], path[-1]) == (u, v)
+                assert len(set(path)) == len(path)
+                assert sum(graph.get_edge_weight(*edge) for edge in zip(path, path[1:])) == distance
+
+
+def test_k_shortest_paths_is_lazy():
+    graph = ds.weighted_path_graph(False)
+    paths = k_shortest_paths(graph, 'a', 'd')
+    assert next(paths) == (list('abefgd'), 5)
+    assert next(paths) == (list('abcd'), 21)
+
+
+@pytest.mark.parametrize(
+    'graph,expected_algorithm',
+    [
+        (ds.path_graph(False), sp.bfs_shortest_path),
+        (ds.weighted_path_graph(False), sp.djikstra),
+        (ds.weighted_path_graph(True), sp.dag_shortest_path),
+        (gc.to_directed(ds.weighted_path_graph(False)), sp.djikstra),
+        (gc.DiGraph(edges=[('a', 'b', 2), ('b', 'a', 2), ('a', 'c', 5), ('b', 'c', -2)]), sp.bellman_ford)
+    ]
+)
+def test_shortest_path_dispatch(graph, expected_algorithm):
+    assert sp._single_source_algorithm(graph) is expected_algorithm
+    distance_dict, prev_dict = sp.floyd_warshall(graph)
+    for u in graph.nodes:
+        for (source, v), (path, distance) in sp.shortest_path(graph, u, None).items():
+            assert source == u
+            assert distance == sp._shortest_path(distance_dict, prev_dict, u, v)[1]
+    for (u, v), (path, distance) in sp.shortest_path(graph, None, None).items():
+        assert distance == sp._shortest_path(distance_dict, prev_dict, u, v)[1]
+
+
+@pytest.mark.parametrize('graph', [ds.weighted_path_graph(False), ds.weighted_path_graph(True), ds.path_graph(True)])
+def test_all_pairs_rows(graph, tmp_path):
+    distance_dict, prev_dict = sp.floyd_warshall(graph)
+    rows = list(all_pairs_rows(graph))
+    assert {source for source, _distances, _predecessors in rows} == graph.nodes
+    for source, distances, predecessors in rows:
+        expected_targets = {v for u, v in prev_dict if u == source}
+        assert set(distances) == set(predecessors) == expected_targets
+        for target, distance in distances.items():
+            assert distance == distance_dict[(source, target)]
+
+    path = str(tmp_path / 'rows.bin')
+    assert write_binary(iter(rows), path, list(graph.nodes)) == len(rows)
+    assert list(read_binary(path)) == rows
+
+    path = str(tmp_path / 'rows.csv')
+    assert write_csv(all_pairs_rows(graph), path) == len(rows)
+    with open(path) as f:
+        assert len(f.readlines()) == 1 + len(prev_dict)
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+@pytest.mark.parametrize('sources', [[0, 7, 19], {0: 0, 7: 3, 19: 1}])
+def test_nearest_source(is_directed, sources):
+    graph = ds.random_graph(40, 100, is_directed=is_directed, max_weight=9, seed=8)
+    offsets = sources if isinstance(sources, dict) else dict.fromkeys(sources, 0)
+    expected = {}
+    for source, offset in offsets.items():
+        distance_dict, _prev_dict = sp.djikstra(graph, source)
+        distances = {node: offset + distance for (_source, node), distance in distance_dict.items()}
+        distances[source] = offset
+        for node, distance in distances.items():
+            expected[node] = min(expected.get(node, float('inf')), distance)
+
+    result = sp.nearest_source(graph, sources)
+    assert {node: distance for (_source, node), (_path, distance) in result.items()} == expected
+    for (source, node), (path, distance) in result.items():
+        assert (path[0], path[-1]) == (source, node)
+        assert offsets[source] + sum(graph.edge_weights[edge] for edge in zip(path, path[1:])) == distance
+
+
+@pytest.mark.parametrize(
+    'graph',
+    [
+        ds.random_graph(60, 300, seed=9),
+        ds.random_graph(100, 250, seed=2),
+        ds.random_graph(60, 150, max_weight=7, seed=10),
+        ds.random_graph(100, 250, max_weight=7, seed=0)
+    ]
+)
+def test_distance_measures(graph):
+    distance_dict, _prev_dict = sp.floyd_warshall(graph)
+    expected = {u: max(distance_dict[(u, v)] for v in graph.g) for u in graph.g}
+
+    eccentricities, n_traversals = dm.eccentricity(graph)
+    assert eccentricities == expected
+    assert n_traversals <= graph.order
+    assert dm.eccentricity(graph, [graph.nodes.pop()])[1] == 1
+
+    expected_diameter = max(expected.values())
+    expected_radius = min(expected.values())
+    assert dm.diameter(graph)[0] == expected_diameter
+    assert dm.radius(graph)[0] == expected_radius
+    assert set(dm.center(graph)[0]) == {node for node, value in expected.items() if value == expected_radius}
+    assert set(dm.periphery(graph)[0]) == {node for node, value in expected.items() if value == expected_diameter}
+
+
+def test_distance_measures_errors():
+    with pytest.raises(TypeError):
+        dm.diameter(ds.path_graph(True))
+    graph = ds.random_graph(60, 300, seed=9)
+    graph.add_node('isolated')
+    with pytest.raises(ValueError):
+        dm.radius(graph)
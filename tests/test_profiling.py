@@ -0,0 +1,62 @@
+
+import tracemalloc
+
+from algorithms.djikstra import djikstra
+from algorithms.floyd_warshall import floyd_warshall
+import datasets as ds
+from profiling import memory
+
+
+def test_graph_footprint():
+    graph = ds.weighted_path_graph()
+    footprint = memory.graph_footprint(graph)
+    assert footprint['total'] == sum(size for part, size in footprint.items() if part != 'total')
+    assert all(size >= 0 for size in footprint.values())
+
+    bigger_graph = ds.random_graph(200, 600, seed=0)
+    assert memory.graph_footprint(bigger_graph)['total'] > footprint['total']
+
+
+def test_graph_footprint_derived_structures():
+    graph = ds.random_graph(200, 600, max_weight=10, seed=0)
+    assert memory.graph_footprint(graph)['id_adjacency'] == 0
+    djikstra(graph, 0)
+    footprint = memory.graph_footprint(graph)
+    assert footprint['id_adjacency'] > 0
+    assert footprint['weight_counts'] > 0
+
+
+def test_peak_memory():
+    graph = ds.random_graph(50, 100, seed=0)
+    result, peak = memory.peak_memory(floyd_warshall, graph)
+    assert result == floyd_warshall(graph)
+    assert peak > 0
+
+
+def test_peak_memory_nested():
+    graph = ds.random_graph(50, 100, seed=0)
+    tracemalloc.start()
+    try:
+        outer = [0] * 1_000_000
+        del outer
+        _result, _peak = memory.peak_memory(floyd_warshall, graph)
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] > 8_000_000
+    finally:
+        tracemalloc.stop()
+
+
+def test_extrapolate():
+    sample = ds.random_graph(200, 600, seed=0)
+    target = ds.random_graph(2000, 6000, seed=1)
+    target.id_adjacency()
+    estimate = memory.extrapolate(sample, target.order, target.size)
+    assert sample._id_adjacency is None
+    assert 0.5 < estimate['graph'] / memory.graph_footprint(target)['total'] < 2
+    assert estimate['floyd_warshall'] > 0
+
+
+def test_profile_datasets():
+    report = memory.profile_datasets(floyd_warshall, {'path_graph': ds.path_graph})
+    assert set(report) == {'path_graph'}
+    assert report['path_graph']['peak'] > 0
@@ -0,0 +1,63 @@
+
+from collections import Counter
+
+import pytest
+
+import datasets as ds
+from exceptions import NodeNotInGraphException
+import graph_cls as gc
+from sampling.random_walks import RandomWalker, _alias_table, random_walks
+
+
+def test_alias_table():
+    weights = [1, 3, 0, 4]
+    prob, alias = _alias_table(weights)
+    # Probability mass of each index: kept in its own column plus received as an alias
+    mass = [0.0] * len(weights)
+    for i in range(len(weights)):
+        mass[i] += prob[i]
+        mass[alias[i]] += 1 - prob[i]
+    assert [value / len(weights) for value in mass] == pytest.approx([w / sum(weights) for w in weights])
+
+
+@pytest.mark.parametrize('p, q', [(1, 1), (0.5, 2)])
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_random_walks_follow_edges(p, q, is_directed):
+    graph = ds.random_graph(50, 150, is_directed=is_directed, max_weight=5, seed=2)
+    walks = random_walks(graph, walk_length=10, walks_per_node=2, p=p, q=q, seed=0)
+    assert len(walks) == 2 * graph.order
+    assert Counter(walk[0] for walk in walks) == Counter({node: 2 for node in graph.g})
+    for walk in walks:
+        assert 1 <= len(walk) <= 10
+        assert all(v in graph.g[u] for u, v in zip(walk, walk[1:]))
+        if len(walk) < 10:
+            assert not graph.g[walk[-1]]
+    assert walks == random_walks(graph, walk_length=10, walks_per_node=2, p=p, q=q, seed=0)
+
+
+def test_random_walks_weighted_transitions():
+    graph = gc.DiGraph(edges=[('a', 'b', 1), ('a', 'c', 3)])
+    walker = RandomWalker(graph)
+    walks = [walk for chunk in walker.walks(2, walks_per_node=4000, start_nodes=['a'], seed=1) for walk in chunk]
+    counts = Counter(walk[1] for walk in walks)
+    assert counts['c'] / len(walks) == pytest.approx(0.75, abs=0.03)
+
+
+def test_random_walks_return_parameter():
+    graph = ds.random_graph(30, 90, seed=5)
+    walker = RandomWalker(graph)
+
+    def return_rate(p):
+        walks = [walk for chunk in walker.walks(3, walks_per_node=50, p=p, seed=0) for walk in chunk]
+        walks = [walk for walk in walks if len(walk) == 3]
+        return sum(walk[0] == walk[2] for walk in walks) / len(walks)
+
+    assert return_rate(0.1) > return_rate(1) > return_rate(10)
+
+
+def test_random_walks_chunks():
+    graph = ds.random_graph(25, 60, seed=6)
+    chunks = list(RandomWalker(graph).walks(5, walks_per_node=2, seed=0, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5, 10, 10, 5]
+    with pytest.raises(NodeNotInGraphException):
+        next(RandomWalker(graph).walks(5, start_nodes=['missing']))